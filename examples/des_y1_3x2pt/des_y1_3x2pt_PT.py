@@ -3,6 +3,7 @@
 """Example factory function for DES Y1 3x2pt likelihood."""
 
 import os
+import functools
 
 from typing import Dict, Union, Tuple
 
@@ -26,11 +27,21 @@ saccfile = os.path.expanduser(
 )
 
 
+@functools.lru_cache(maxsize=1)
+def load_sacc_data() -> sacc.Sacc:
+    """Load the DES Y1 3x2pt SACC file.
+
+    The file is read only once per process; the likelihood and the reference
+    calculation in :python:`run_likelihood` share the same (unmodified) data.
+    """
+    return sacc.Sacc.load_fits(saccfile)
+
+
 def build_likelihood(_) -> Tuple[Likelihood, ModelingTools]:
     """Likelihood factory function for DES Y1 3x2pt analysis."""
 
     # Load sacc file
-    sacc_data = sacc.Sacc.load_fits(saccfile)
+    sacc_data = load_sacc_data()
 
     # Define sources
     sources: Dict[str, Union[wl.WeakLensing, nc.NumberCounts]] = {}
@@ -58,31 +69,31 @@ def build_likelihood(_) -> Tuple[Likelihood, ModelingTools]:
     )
 
     # Define the statistics we like to include in the likelihood
-    # The only place the dict 'stats' gets used, other than setting values in
-    # it, is to call 'values' on it. Thus we don't need a dict, we need a list
-    # of the values. The keys assigned to the dict are never used.
-    stats = {}
-    for stat, sacc_stat in [
-        ("xip", "galaxy_shear_xi_plus"),
-        ("xim", "galaxy_shear_xi_minus"),
-    ]:
+    stats = []
+    for sacc_stat in ["galaxy_shear_xi_plus", "galaxy_shear_xi_minus"]:
         # Define two-point statistics, given two sources (from above) and
         # the type of statistic.
-        stats[f"{stat}_src0_src0"] = TwoPoint(
-            source0=sources["src0"],
+        stats.append(
+            TwoPoint(
+                source0=sources["src0"],
+                source1=sources["src0"],
+                sacc_data_type=sacc_stat,
+            )
+        )
+    stats.append(
+        TwoPoint(
+            source0=sources["lens0"],
             source1=sources["src0"],
-            sacc_data_type=sacc_stat,
+            sacc_data_type="galaxy_shearDensity_xi_t",
         )
-    stats["gammat_lens0_src0"] = TwoPoint(
-        source0=sources["lens0"],
-        source1=sources["src0"],
-        sacc_data_type="galaxy_shearDensity_xi_t",
     )
 
-    stats["wtheta_lens0_lens0"] = TwoPoint(
-        source0=sources["lens0"],
-        source1=sources["lens0"],
-        sacc_data_type="galaxy_density_xi",
+    stats.append(
+        TwoPoint(
+            source0=sources["lens0"],
+            source1=sources["lens0"],
+            sacc_data_type="galaxy_density_xi",
+        )
     )
 
     # Create the likelihood from the statistics
@@ -95,7 +106,7 @@ def build_likelihood(_) -> Tuple[Likelihood, ModelingTools]:
     )
 
     modeling_tools = ModelingTools(pt_calculator=pt_calculator)
-    likelihood = ConstGaussian(statistics=list(stats.values()))
+    likelihood = ConstGaussian(statistics=stats)
 
     # Read the two-point data from the sacc file
     likelihood.read(sacc_data)
@@ -126,7 +137,7 @@ def run_likelihood() -> None:
     likelihood, tools = build_likelihood(None)
 
     # Load sacc file
-    sacc_data = sacc.Sacc.load_fits(saccfile)
+    sacc_data = load_sacc_data()
 
     src0_tracer = sacc_data.get_tracer("src0")
     lens0_tracer = sacc_data.get_tracer("lens0")
@@ -152,30 +163,6 @@ def run_likelihood() -> None:
         ccl_cosmo, z=z, a1=a_1, a1delta=a_d, a2=a_2, Om_m2_for_c2=False
     )
 
-    # Code that creates a Pk2D object:
-    ptc = pyccl.nl_pt.EulerianPTCalculator(
-        with_NC=True,
-        with_IA=True,
-        log10k_min=-4,
-        log10k_max=2,
-        nk_per_decade=20,
-        cosmo=ccl_cosmo,
-    )
-    ptt_i = pyccl.nl_pt.PTIntrinsicAlignmentTracer(
-        c1=(z, c_1), c2=(z, c_2), cdelta=(z, c_d)
-    )
-    ptt_m = pyccl.nl_pt.PTMatterTracer()
-    ptt_g = pyccl.nl_pt.PTNumberCountsTracer(b1=b_1, b2=b_2, bs=b_s)
-    # IA
-    pk_im = ptc.get_biased_pk2d(ccl_cosmo, ptt_i, tracer2=ptt_m)
-    pk_ii = ptc.get_biased_pk2d(ccl_cosmo, tracer1=ptt_i, tracer2=ptt_i)
-    pk_gi = ptc.get_biased_pk2d(ccl_cosmo, tracer1=ptt_g, tracer2=ptt_i)
-    # Galaxies
-    pk_gm = ptc.get_biased_pk2d(ccl_cosmo, tracer1=ptt_g, tracer2=ptt_m)
-    pk_gg = ptc.get_biased_pk2d(ccl_cosmo, tracer1=ptt_g, tracer2=ptt_g)
-    # Magnification: just a matter-matter P(k)
-    pk_mm = ptc.get_biased_pk2d(ccl_cosmo, tracer1=ptt_m, tracer2=ptt_m)
-
     # Set the parameters for our systematics
     systematics_params = ParamsMap(
         {
@@ -197,6 +184,29 @@ def run_likelihood() -> None:
     # Prepare the cosmology object
     tools.prepare(ccl_cosmo)
 
+    # Code that creates the Pk2D objects. We reuse the PT calculator of the
+    # modeling tools, whose ingredients have already been computed for this
+    # cosmology by tools.prepare, rather than building and initializing a
+    # second one.
+    ptc = tools.get_pt_calculator()
+    ptt_i = pyccl.nl_pt.PTIntrinsicAlignmentTracer(
+        c1=(z, c_1), c2=(z, c_2), cdelta=(z, c_d)
+    )
+    ptt_m = pyccl.nl_pt.PTMatterTracer()
+    ptt_g = pyccl.nl_pt.PTNumberCountsTracer(b1=b_1, b2=b_2, bs=b_s)
+    # IA: im, ii, gi; Galaxies: gm, gg; Magnification: just a matter-matter P(k)
+    pks = {
+        name: ptc.get_biased_pk2d(ccl_cosmo, tracer1=tracer1, tracer2=tracer2)
+        for name, tracer1, tracer2 in [
+            ("im", ptt_i, ptt_m),
+            ("ii", ptt_i, ptt_i),
+            ("gi", ptt_g, ptt_i),
+            ("gm", ptt_g, ptt_m),
+            ("gg", ptt_g, ptt_g),
+            ("mm", ptt_m, ptt_m),
+        ]
+    }
+
     # Compute the log-likelihood, using the ccl.Cosmology object as the input
     log_like = likelihood.compute_loglike(tools)
 
@@ -250,21 +260,28 @@ def run_likelihood() -> None:
         has_rsd=True,
         dndz=(lens_z, lens_nz),
         bias=None,
-        mag_bias=(lens_z, mag_bias * np.ones_like(lens_z)),
+        mag_bias=(lens_z, np.full_like(lens_z, mag_bias)),
+    )
+    # Each CCL tracer evaluates and stores its radial kernels when it is
+    # constructed, so the kernels of t_lens, t_ia, t_g and t_m are shared by all
+    # the spectra below rather than being recomputed for every pair.
+    cl_GI, cl_II, cl_GG, cl_gG, cl_gI, cl_gg, cl_mI, cl_gm, cl_mm = (
+        ccl.angular_cl(ccl_cosmo, tracer1, tracer2, ells, p_of_k_a=pk)
+        for tracer1, tracer2, pk in [
+            (t_lens, t_ia, pks["im"]),
+            (t_ia, t_ia, pks["ii"]),
+            # The weak gravitational lensing power spectrum
+            (t_lens, t_lens, "delta_matter:delta_matter"),
+            # Galaxies
+            (t_g, t_lens, pks["gm"]),
+            (t_g, t_ia, pks["gi"]),
+            (t_g, t_g, pks["gg"]),
+            # Magnification
+            (t_m, t_ia, pks["im"]),
+            (t_g, t_m, pks["gm"]),
+            (t_m, t_m, pks["mm"]),
+        ]
     )
-    cl_GI = ccl.angular_cl(ccl_cosmo, t_lens, t_ia, ells, p_of_k_a=pk_im)
-    cl_II = ccl.angular_cl(ccl_cosmo, t_ia, t_ia, ells, p_of_k_a=pk_ii)
-    # The weak gravitational lensing power spectrum
-    cl_GG = ccl.angular_cl(ccl_cosmo, t_lens, t_lens, ells)
-
-    # Galaxies
-    cl_gG = ccl.angular_cl(ccl_cosmo, t_g, t_lens, ells, p_of_k_a=pk_gm)
-    cl_gI = ccl.angular_cl(ccl_cosmo, t_g, t_ia, ells, p_of_k_a=pk_gi)
-    cl_gg = ccl.angular_cl(ccl_cosmo, t_g, t_g, ells, p_of_k_a=pk_gg)
-    # Magnification
-    cl_mI = ccl.angular_cl(ccl_cosmo, t_m, t_ia, ells, p_of_k_a=pk_im)
-    cl_gm = ccl.angular_cl(ccl_cosmo, t_g, t_m, ells, p_of_k_a=pk_gm)
-    cl_mm = ccl.angular_cl(ccl_cosmo, t_m, t_m, ells, p_of_k_a=pk_mm)
 
     # The observed angular power spectrum is the sum of the two.
     cl_cs_theory = cl_GG + 2 * cl_GI + cl_II
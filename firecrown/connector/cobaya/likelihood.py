@@ -5,7 +5,7 @@ Module for providing a likelihood for use in Cobaya.
 This module provides the class :class:`LikelihoodConnector`, which is an implementation
 of a Cobaya likelihood.
 """
-from typing import List, Dict, Union
+from typing import List, Dict, Optional, Union
 
 import numpy as np
 import numpy.typing as npt
@@ -34,6 +34,14 @@ class LikelihoodConnector(Likelihood):
         self.likelihood, self.tools = load_likelihood(
             self.firecrownIni, build_parameters
         )
+        # The requirements of the likelihood, built by the first call of
+        # get_requirements.
+        self._likelihood_requires: Optional[
+            Dict[
+                str,
+                Union[None, Dict[str, npt.NDArray[np.float64]], Dict[str, object]],
+            ]
+        ] = None
 
     def get_param(self, p: str):
         """Return the current value of the parameter named 'p'."""
@@ -74,16 +82,19 @@ class LikelihoodConnector(Likelihood):
 
         Returns a dictionary with keys corresponding the contained likelihood's
         required parameter, plus "pyccl". All values are None.
-        """
-        likelihood_requires: Dict[
-            str, Union[None, Dict[str, npt.NDArray[np.float64]], Dict[str, object]]
-        ] = {"pyccl": None}
-        required_params = self.likelihood.required_parameters()
 
-        for param_name in required_params.get_params_names():
-            likelihood_requires[param_name] = None
+        The required parameters of the likelihood do not change after it is
+        loaded, so the dictionary is built only on the first call; each call
+        returns a copy of it.
+        """
+        if self._likelihood_requires is None:
+            required_params = self.likelihood.required_parameters()
+            self._likelihood_requires = {
+                "pyccl": None,
+                **dict.fromkeys(required_params.get_params_names()),
+            }
 
-        return likelihood_requires
+        return dict(self._likelihood_requires)
 
     def must_provide(self, **requirements):
         """Required by Cobaya.
@@ -105,8 +116,12 @@ class LikelihoodConnector(Likelihood):
 
         derived_params_collection = self.likelihood.get_derived_parameters()
         assert derived_params_collection is not None
-        for section, name, val in derived_params_collection:
-            params_values["_derived"][f"{section}__{name}"] = val
+        params_values["_derived"].update(
+            {
+                f"{section}__{name}": val
+                for section, name, val in derived_params_collection
+            }
+        )
 
         self.likelihood.reset()
         self.tools.reset()
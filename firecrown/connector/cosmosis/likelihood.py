@@ -8,6 +8,7 @@ likelihood abstract base class; it the implementation of a CosmoSIS module,
 not a specific likelihood.
 """
 
+from typing import Dict
 
 import cosmosis.datablock
 from cosmosis.datablock import option_section
@@ -52,12 +53,15 @@ class FirecrownLikelihood:
             option_section, "require_nonlinear_pk", False
         )
 
+        debug_datablock = config.get_bool(option_section, "debug_datablock", False)
+
         build_parameters = extract_section(config, option_section)
 
         sections = config.get_string(option_section, "sampling_parameters_sections", "")
         sections = sections.split()
 
         self.firecrown_module_name = option_section
+        self.debug_datablock = debug_datablock
         self.sampling_sections = sections
         self.likelihood, self.tools = load_likelihood(
             likelihood_source, build_parameters
@@ -110,11 +114,16 @@ class FirecrownLikelihood:
         )
 
         # Write out theory and data vectors to the data block the ease
-        # debugging.
+        # debugging. This is only done when requested through the
+        # `debug_datablock` option, since it copies every statistic into the
+        # data block for every sample.
         # TODO: This logic should be moved into the TwoPoint statistic, and
         # some method in the Statistic base class should be called here. For
         # statistics other than TwoPoint, the base class implementation should
         # do nothing.
+        if not self.debug_datablock:
+            return 0
+
         for stat in self.likelihood.statistics:
             if isinstance(stat, TwoPoint):
                 assert stat.sacc_tracers is not None
@@ -141,10 +150,10 @@ class FirecrownLikelihood:
     def calculate_firecrown_params(self, sample: cosmosis.datablock) -> ParamsMap:
         """Calculate the ParamsMap for this sample."""
 
-        firecrown_params = ParamsMap()
+        merged_params: Dict[str, float] = {}
         for section in self.sampling_sections:
             section_params = extract_section(sample, section)
-            shared_keys = section_params.to_set().intersection(firecrown_params)
+            shared_keys = section_params.data.keys() & merged_params.keys()
             if len(shared_keys) > 0:
                 raise RuntimeError(
                     f"The following keys `{shared_keys}' appear "
@@ -152,8 +161,11 @@ class FirecrownLikelihood:
                     f"module {self.firecrown_module_name}."
                 )
 
-            firecrown_params = ParamsMap({**firecrown_params, **section_params.data})
+            # The sampling sections hold the values of the sampled parameters,
+            # which ParamsMap holds as floats.
+            merged_params.update({k: float(v) for k, v in section_params.data.items()})
 
+        firecrown_params = ParamsMap(merged_params)
         firecrown_params.use_lower_case_keys(True)
         return firecrown_params
 
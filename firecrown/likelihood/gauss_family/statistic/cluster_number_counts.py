@@ -92,12 +92,13 @@ class ClusterNumberCounts(Statistic):
     @final
     def _get_derived_parameters(self) -> DerivedParameterCollection:
         """Return an empty DerivedParameterCollection."""
-        derived_parameters = DerivedParameterCollection([])
-        derived_parameters += self.cluster_abundance.get_derived_parameters()
-        derived_parameters += self.cluster_mass.get_derived_parameters()
-        derived_parameters += self.cluster_redshift.get_derived_parameters()
-
-        return derived_parameters
+        return DerivedParameterCollection.concatenate(
+            [
+                self.cluster_abundance.get_derived_parameters(),
+                self.cluster_mass.get_derived_parameters(),
+                self.cluster_redshift.get_derived_parameters(),
+            ]
+        )
 
     def _read_data_type(self, sacc_data, data_type):
         """Internal function to read the data from the SACC file."""
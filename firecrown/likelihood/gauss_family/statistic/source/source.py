@@ -3,7 +3,7 @@
 """
 
 from __future__ import annotations
-from typing import Optional, Sequence, final
+from typing import Optional, Sequence, Tuple, final
 from abc import abstractmethod
 import sacc
 
@@ -38,14 +38,32 @@ class Source(Updatable):
 
     systematics: Sequence[SourceSystematic]
     cosmo_hash: Optional[int]
+    params_values: Optional[Tuple[float, ...]]
+    tracer_params_names: Optional[Tuple[str, ...]]
+    tracers_params_values: Optional[Tuple[float, ...]]
     tracers: Sequence[Tracer]
 
+    def __init__(self) -> None:
+        """Initialize the Source with no systematics and no cached tracers."""
+        super().__init__()
+        self.systematics = []
+        self.cosmo_hash = None
+        self.params_values = None
+        self.tracer_params_names = None
+        self.tracers_params_values = None
+        self.tracers = []
+
     @final
     def read(self, sacc_data: sacc.Sacc):
-        """Read the data for this source from the SACC file."""
-        if hasattr(self, "systematics"):
-            for systematic in self.systematics:
-                systematic.read(sacc_data)
+        """Read the data for this source from the SACC file.
+
+        Any cached tracers were built from the previously read data, so they
+        are discarded."""
+        self.cosmo_hash = None
+        self.tracers_params_values = None
+        self.tracers = []
+        for systematic in self.systematics:
+            systematic.read(sacc_data)
         self._read(sacc_data)
 
     @abstractmethod
@@ -65,10 +83,18 @@ class Source(Updatable):
     def _update(self, params: ParamsMap):
         """Implementation of Updatable interface method `_update`.
 
-        This clears the current hash and tracer, and calls the abstract method
-        `_update_source`, which must be implemented in all subclasses."""
-        self.cosmo_hash = None
-        self.tracers = []
+        This records the values of the parameters this source depends upon
+        (their names are collected once, on the first update), and calls the
+        abstract method `_update_source`, which must be implemented in all
+        subclasses. The cached tracers are kept; they are rebuilt by `get_tracers`
+        only if these values or the cosmology changed."""
+        names = self.tracer_params_names
+        if names is None:
+            names = tuple(sorted(self.required_parameters().get_params_names()))
+            self.tracer_params_names = names
+        self.params_values = tuple(
+            params.get_from_prefix_param(None, name) for name in names
+        )
         self._update_source(params)
 
     @final
@@ -93,16 +119,20 @@ class Source(Updatable):
         """Return the tracer for the given cosmology.
 
         This method caches its result, so if called a second time with the same
-        cosmology, no calculation needs to be done."""
-
-        ccl_cosmo = tools.get_ccl_cosmology()
-
-        cur_hash = hash(ccl_cosmo)
-        if hasattr(self, "cosmo_hash") and self.cosmo_hash == cur_hash:
+        cosmology and the same values for the parameters of this source, no
+        calculation needs to be done."""
+
+        cur_hash = tools.get_ccl_cosmology_hash()
+        if (
+            self.cosmo_hash == cur_hash
+            and self.tracers_params_values is not None
+            and self.tracers_params_values == self.params_values
+        ):
             return self.tracers
 
         self.tracers, _ = self.create_tracers(tools)
         self.cosmo_hash = cur_hash
+        self.tracers_params_values = self.params_values
         return self.tracers
 
 
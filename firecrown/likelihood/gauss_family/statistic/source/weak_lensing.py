@@ -196,6 +196,19 @@ class TattAlignmentSystematic(WeakLensingSystematic):
         self.ia_a_d = parameters.create()
 
         self.sacc_tracer = sacc_tracer
+        # Only the IA normalizations for unit amplitudes are cached, keyed on the
+        # cosmology hash and the redshift array; see _get_unit_norms.
+        self.unit_norms_cache: Optional[
+            Tuple[
+                int,
+                npt.NDArray[np.float64],
+                Tuple[
+                    npt.NDArray[np.float64],
+                    npt.NDArray[np.float64],
+                    npt.NDArray[np.float64],
+                ],
+            ]
+        ] = None
 
     @final
     def _reset(self) -> None:
@@ -217,24 +230,52 @@ class TattAlignmentSystematic(WeakLensingSystematic):
         """Return a new linear alignment systematic, based on the given
         tracer_arg, in the context of the given cosmology."""
 
-        ccl_cosmo = tools.get_ccl_cosmology()
         z = tracer_arg.z
-        c_1, c_d, c_2 = pyccl.nl_pt.translate_IA_norm(
-            ccl_cosmo,
-            z=z,
-            a1=self.ia_a_1,
-            a1delta=self.ia_a_d,
-            a2=self.ia_a_2,
-            Om_m2_for_c2=False,
-        )
+        c_1, c_d, c_2 = self._get_unit_norms(tools, z)
 
         return replace(
             tracer_arg,
             has_pt=True,
-            ia_pt_c_1=(z, c_1),
-            ia_pt_c_d=(z, c_d),
-            ia_pt_c_2=(z, c_2),
+            ia_pt_c_1=(z, self.ia_a_1 * c_1),
+            ia_pt_c_d=(z, self.ia_a_d * c_d),
+            ia_pt_c_2=(z, self.ia_a_2 * c_2),
+        )
+
+    def _get_unit_norms(
+        self, tools: ModelingTools, z: npt.NDArray[np.float64]
+    ) -> Tuple[
+        npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]
+    ]:
+        """Return the IA normalizations for unit amplitudes at redshifts `z`.
+
+        The growth factor lookups are only redone when the cosmology or the
+        redshifts have changed since the last call.
+
+        The callers scale these normalizations by the current amplitudes. This
+        relies on pyccl.nl_pt.translate_IA_norm being linear in a1, a1delta and
+        a2, which holds only for Om_m2_for_c2=False: c_1 and c_d are
+        proportional to Omega_m / D(z) and c_2 to Omega_m / D(z)^2, each times
+        its amplitude. Any change to the arguments below must preserve that."""
+
+        cosmo_hash = tools.get_ccl_cosmology_hash()
+        cached = self.unit_norms_cache
+        if (
+            cached is not None
+            and cached[0] == cosmo_hash
+            and np.array_equal(cached[1], z)
+        ):
+            return cached[2]
+
+        unit_norms = pyccl.nl_pt.translate_IA_norm(
+            tools.get_ccl_cosmology(),
+            z=z,
+            a1=1.0,
+            a1delta=1.0,
+            a2=1.0,
+            Om_m2_for_c2=False,
         )
+        self.unit_norms_cache = (cosmo_hash, z.copy(), unit_norms)
+        return unit_norms
 
 
 class PhotoZShift(WeakLensingSystematic):
@@ -26,7 +26,7 @@ class DataVector(npt.NDArray[np.float64]):
 
     @classmethod
     def create(cls, vals: npt.NDArray[np.float64]) -> DataVector:
-        """Create a DataVector that wraps a copy of the given array vals."""
+        """Create a DataVector that wraps the given array vals, without copying it."""
         return vals.view(cls)
 
     @classmethod
@@ -42,7 +42,7 @@ class TheoryVector(npt.NDArray[np.float64]):
 
     @classmethod
     def create(cls, vals: npt.NDArray[np.float64]) -> TheoryVector:
-        """Create a TheoryVector that wraps a copy of the given array vals."""
+        """Create a TheoryVector that wraps the given array vals, without copying it."""
         return vals.view(cls)
 
     @classmethod
@@ -2,7 +2,7 @@
 """
 
 from __future__ import annotations
-from typing import Optional, final
+from typing import Optional, Tuple, final
 
 import numpy as np
 import numpy.typing as npt
@@ -28,6 +28,7 @@ class Supernova(Statistic):
         self.data_vector: Optional[DataVector] = None
         self.a: Optional[npt.NDArray[np.float64]] = None
         self.M = parameters.create()
+        self.mu_cache: Optional[Tuple[int, npt.NDArray[np.float64]]] = None
 
     def read(self, sacc_data: sacc.Sacc):
         """Read the data for this statistic from the SACC file."""
@@ -35,10 +36,18 @@ class Supernova(Statistic):
         data_points = sacc_data.get_data_points(
             data_type="supernova_distance_mu", tracers=(self.sacc_tracer,)
         )
-        z = np.array([dp.get_tag("z") for dp in data_points])
-        self.a = 1.0 / (1.0 + z)
-        self.data_vector = DataVector.from_list([dp.value for dp in data_points])
-        self.sacc_indices = np.arange(len(self.data_vector))
+        n = len(data_points)
+        # A single pass over the data points fills both columns of a record
+        # array.
+        records = np.fromiter(
+            ((dp.get_tag("z"), dp.value) for dp in data_points),
+            dtype=[("z", np.float64), ("mu", np.float64)],
+            count=n,
+        )
+        self.a = np.reciprocal(1.0 + records["z"])
+        self.data_vector = DataVector.create(np.ascontiguousarray(records["mu"]))
+        self.sacc_indices = np.arange(n, dtype=np.int64)
+        self.mu_cache = None
 
     @final
     def _reset(self):
@@ -60,8 +69,18 @@ class Supernova(Statistic):
         return self.data_vector
 
     def compute_theory_vector(self, tools: ModelingTools) -> TheoryVector:
-        """Compute SNIa distance statistic using CCL."""
+        """Compute SNIa distance statistic using CCL.
+
+        The distance modulus depends only on the cosmology, so it is cached and
+        reused as long as the cosmology is unchanged; only the shift M is applied
+        on every call."""
 
         ccl_cosmo = tools.get_ccl_cosmology()
-        prediction = self.M + pyccl.distance_modulus(ccl_cosmo, self.a)
+        cur_hash = tools.get_ccl_cosmology_hash()
+        if self.mu_cache is not None and self.mu_cache[0] == cur_hash:
+            distance_modulus = self.mu_cache[1]
+        else:
+            distance_modulus = pyccl.distance_modulus(ccl_cosmo, self.a)
+            self.mu_cache = (cur_hash, distance_modulus)
+        prediction = distance_modulus + self.M
         return TheoryVector.create(prediction)
@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 from typing import Dict, Tuple, Optional, final, Union
-import copy
 import functools
 import warnings
 
@@ -11,6 +10,7 @@ import numpy as np
 import numpy.typing as npt
 import sacc.windows
 import scipy.interpolate
+import scipy.sparse
 
 import pyccl
 import pyccl.nl_pt
@@ -37,6 +37,10 @@ SACC_DATA_TYPE_TO_CCL_KIND = {
 
 ELL_FOR_XI_DEFAULTS = {"minimum": 2, "midpoint": 50, "maximum": 6e4, "n_log": 200}
 
+# Bandpower window weights with at most this fraction of non-zero entries are
+# stored as a sparse matrix.
+SPARSE_WINDOW_MAX_DENSITY = 0.2
+
 
 def _ell_for_xi(*, minimum, midpoint, maximum, n_log) -> npt.NDArray[np.float64]:
     """Build an array of ells to sample the power spectrum for real-space
@@ -46,28 +50,35 @@ def _ell_for_xi(*, minimum, midpoint, maximum, n_log) -> npt.NDArray[np.float64]
     Starting from mid, and going up to max, there will be n_log
     logarithmically spaced values. All values are rounded to the nearest
     integer.
+
+    The result is cached, and shared between all callers using the same
+    arguments; it is therefore read-only.
     """
-    lower_range = np.linspace(minimum, midpoint - 1, midpoint - minimum)
-    upper_range = np.logspace(np.log10(midpoint), np.log10(maximum), n_log)
-    concatenated = np.concatenate((lower_range, upper_range))
-    # Round the results to the nearest integer values.
+    return _cached_ell_for_xi(minimum, midpoint, maximum, n_log)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_ell_for_xi(minimum, midpoint, maximum, n_log) -> npt.NDArray[np.float64]:
+    """Implementation of _ell_for_xi, memoized on its four scalar arguments."""
+    # The lower range already holds integral values; only the logarithmically
+    # spaced upper range needs to be rounded to the nearest integer values.
+    lower_range = np.arange(minimum, midpoint, dtype=np.float64)
+    upper_range = np.around(np.logspace(np.log10(midpoint), np.log10(maximum), n_log))
     # N.B. the dtype of the result is np.dtype[float64]
-    return np.around(concatenated)
+    result = np.concatenate((lower_range, upper_range), dtype=np.float64)
+    result.setflags(write=False)
+    return result
 
 
 def _generate_ell_or_theta(*, minimum, maximum, n, binning="log"):
+    # The (geometric) midpoints of n bins with (log) evenly spaced edges are
+    # themselves (log) evenly spaced, starting half a bin after the first edge.
     if binning == "log":
-        edges = np.logspace(np.log10(minimum), np.log10(maximum), n + 1)
-        return np.sqrt(edges[1:] * edges[:-1])
-    edges = np.linspace(minimum, maximum, n + 1)
-    return (edges[1:] + edges[:-1]) / 2.0
-
-
-@functools.lru_cache(maxsize=128)
-def _cached_angular_cl(cosmo, tracers, ells, p_of_k_a=None):
-    return pyccl.angular_cl(
-        cosmo, tracers[0], tracers[1], np.array(ells), p_of_k_a=p_of_k_a
-    )
+        lower, upper = np.log10(minimum), np.log10(maximum)
+        half_bin = 0.5 * (upper - lower) / n
+        return np.logspace(lower + half_bin, upper - half_bin, n)
+    half_bin = 0.5 * (maximum - minimum) / n
+    return np.linspace(minimum + half_bin, maximum - half_bin, n)
 
 
 def make_log_interpolator(x, y):
@@ -83,13 +94,39 @@ def make_log_interpolator(x, y):
     # this in any way.
     if np.all(y > 0):
         # use log-log interpolation
-        intp = scipy.interpolate.InterpolatedUnivariateSpline(
-            np.log(x), np.log(y), ext=2
+        tck = scipy.interpolate.splrep(np.log(x), np.log(y), s=0)
+        return lambda x_, tck=tck: np.exp(
+            scipy.interpolate.splev(np.log(x_), tck, ext=2)
         )
-        return lambda x_, intp=intp: np.exp(intp(np.log(x_)))
     # only use log for x
-    intp = scipy.interpolate.InterpolatedUnivariateSpline(np.log(x), y, ext=2)
-    return lambda x_, intp=intp: intp(np.log(x_))
+    tck = scipy.interpolate.splrep(np.log(x), y, s=0)
+    return lambda x_, tck=tck: scipy.interpolate.splev(np.log(x_), tck, ext=2)
+
+
+def make_log_interpolation_matrix(
+    x: npt.NDArray[np.float64], x_new: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Return the matrix that maps values sampled at x to the values at x_new
+    of their interpolating spline in log(x).
+
+    The interpolating spline built by make_log_interpolator depends linearly on
+    the interpolated values, so the spline through the values y, evaluated at
+    log(x_new), is the product of the returned matrix with y. The matrix only
+    depends on the sampling points, so it can be computed once and reused for
+    every new set of values. As for make_log_interpolator, x_new must be in
+    the range of x, otherwise a ValueError is raised.
+    """
+    log_x = np.log(x)
+    log_x_new = np.log(x_new)
+    basis = np.eye(log_x.size)
+    return np.column_stack(
+        [
+            scipy.interpolate.splev(
+                log_x_new, scipy.interpolate.splrep(log_x, e, s=0), ext=2
+            )
+            for e in basis
+        ]
+    )
 
 
 class TwoPoint(Statistic):
@@ -193,7 +230,7 @@ class TwoPoint(Statistic):
         self.sacc_data_type = sacc_data_type
         self.source0 = source0
         self.source1 = source1
-        self.ell_for_xi = copy.deepcopy(ELL_FOR_XI_DEFAULTS)
+        self.ell_for_xi = dict(ELL_FOR_XI_DEFAULTS)
         if ell_for_xi is not None:
             self.ell_for_xi.update(ell_for_xi)
         # What is the difference between the following 3 instance variables?
@@ -204,6 +241,11 @@ class TwoPoint(Statistic):
         self.ell_or_theta_min = ell_or_theta_min
         self.ell_or_theta_max = ell_or_theta_max
         self.theory_window_function: Optional[sacc.windows.BandpowerWindow] = None
+        self.window_weight_t: Optional[
+            Union[npt.NDArray[np.float64], scipy.sparse.csr_matrix]
+        ] = None
+        self.window_ell_or_theta: Optional[npt.NDArray[np.float64]] = None
+        self.window_interpolation: Optional[npt.NDArray[np.float64]] = None
 
         self.data_vector: Optional[DataVector] = None
         self.theory_vector: Optional[TheoryVector] = None
@@ -214,7 +256,17 @@ class TwoPoint(Statistic):
 
         self.sacc_tracers: Tuple[str, str]
         self.ells: Optional[npt.NDArray[np.float64]] = None
+        self.theta_for_xi: Optional[npt.NDArray[np.float64]] = None
         self.cells: Dict[Union[Tuple[str, str], str], npt.NDArray[np.float64]] = {}
+        self.cl_cache: Dict[
+            Tuple[str, str],
+            Tuple[int, pyccl.Tracer, pyccl.Tracer, npt.NDArray[np.float64]],
+        ] = {}
+        # The last correlation function computed, with the hash of the cosmology
+        # and the total cells it was computed from.
+        self.xi_cache: Optional[
+            Tuple[int, npt.NDArray[np.float64], npt.NDArray[np.float64]]
+        ] = None
 
         if self.sacc_data_type in SACC_DATA_TYPE_TO_CCL_KIND:
             self.ccl_kind = SACC_DATA_TYPE_TO_CCL_KIND[self.sacc_data_type]
@@ -238,10 +290,12 @@ class TwoPoint(Statistic):
 
     @final
     def _get_derived_parameters(self) -> DerivedParameterCollection:
-        derived_parameters = DerivedParameterCollection([])
-        derived_parameters = derived_parameters + self.source0.get_derived_parameters()
-        derived_parameters = derived_parameters + self.source1.get_derived_parameters()
-        return derived_parameters
+        return DerivedParameterCollection.concatenate(
+            [
+                self.source0.get_derived_parameters(),
+                self.source1.get_derived_parameters(),
+            ]
+        )
 
     def read(self, sacc_data: sacc.Sacc) -> None:
         """Read the data for this statistic from the SACC file.
@@ -280,37 +334,69 @@ class TwoPoint(Statistic):
             )
 
         # at this point we default to the values in the sacc file
+        sacc_indices: Optional[npt.NDArray[np.int64]] = None
         if len(_ell_or_theta) == 0 or len(_stat) == 0:
             _ell_or_theta = _generate_ell_or_theta(**self.ell_or_theta)
             _stat = np.zeros_like(_ell_or_theta)
         else:
-            self.sacc_indices = np.atleast_1d(
-                sacc_data.indices(self.sacc_data_type, tracers)
-            )
-
-        if self.ell_or_theta_min is not None:
-            locations = np.where(_ell_or_theta >= self.ell_or_theta_min)
-            _ell_or_theta = _ell_or_theta[locations]
-            _stat = _stat[locations]
-            if self.sacc_indices is not None:
-                self.sacc_indices = self.sacc_indices[locations]
-
-        if self.ell_or_theta_max is not None:
-            locations = np.where(_ell_or_theta <= self.ell_or_theta_max)
-            _ell_or_theta = _ell_or_theta[locations]
-            _stat = _stat[locations]
-            if self.sacc_indices is not None:
-                self.sacc_indices = self.sacc_indices[locations]
-
-        self.theory_window_function = sacc_data.get_bandpower_windows(self.sacc_indices)
+            sacc_indices = sacc_data.indices(self.sacc_data_type, tracers)
+
+        if self.ell_or_theta_min is not None or self.ell_or_theta_max is not None:
+            lower = -np.inf if self.ell_or_theta_min is None else self.ell_or_theta_min
+            upper = np.inf if self.ell_or_theta_max is None else self.ell_or_theta_max
+            mask = (_ell_or_theta >= lower) & (_ell_or_theta <= upper)
+            if not mask.all():
+                _ell_or_theta = _ell_or_theta[mask]
+                _stat = _stat[mask]
+                if sacc_indices is not None:
+                    sacc_indices = sacc_indices[mask]
+
+        # Generated ell or theta values have neither SACC indices nor a window.
+        if sacc_indices is not None:
+            self.sacc_indices = sacc_indices
+            self.theory_window_function = sacc_data.get_bandpower_windows(sacc_indices)
+        else:
+            self.theory_window_function = None
         if self.theory_window_function is not None:
             _ell_or_theta = self.calculate_ell_or_theta()
+            # The window function does not change after this point, so we keep a
+            # contiguous copy of its transposed weights, and the (fixed) effective
+            # ell values of the bandpowers. Bandpower windows are usually narrow,
+            # in which case a sparse copy of the weights is cheaper to apply.
+            weight_t = self.theory_window_function.weight.T
+            if np.count_nonzero(weight_t) <= SPARSE_WINDOW_MAX_DENSITY * weight_t.size:
+                self.window_weight_t = scipy.sparse.csr_matrix(weight_t)
+            else:
+                self.window_weight_t = np.ascontiguousarray(weight_t)
+            self.window_ell_or_theta = (
+                self.window_weight_t @ self.theory_window_function.values
+            )
+            # The theory vector is interpolated to the window ell values (but for
+            # ell=0 and ell=1) always from the same ell values.
+            self.window_interpolation = make_log_interpolation_matrix(
+                _ell_or_theta, self.theory_window_function.values[2:]
+            )
 
-        # I don't think we need these copies, but being safe here.
-        self._ell_or_theta = _ell_or_theta.copy()
+        # This array is owned by this object; it is made read-only rather than
+        # copied, so that it can not be modified by mistake.
+        _ell_or_theta.setflags(write=False)
+        self._ell_or_theta = _ell_or_theta
         self.data_vector = DataVector.create(_stat)
         self.measured_statistic_ = self.data_vector
         self.sacc_tracers = tracers
+        # The cached spectra and correlation function were computed for the ell
+        # and theta values of the previous read, if any.
+        self.cl_cache.clear()
+        self.xi_cache = None
+        # The ells at which the angular power spectra are computed. For a
+        # real-space statistic, compute_theory_vector builds them again if
+        # ell_for_xi is changed after this.
+        if self.ccl_kind == "cl":
+            self.ells = self._ell_or_theta
+        else:
+            self.ells = _ell_for_xi(**self.ell_for_xi)
+            # CCL expects the angles in degrees, rather than arcmin.
+            self.theta_for_xi = _ell_or_theta / 60
 
     def calculate_ell_or_theta(self):
         """See _ell_for_xi.
@@ -344,17 +430,25 @@ class TwoPoint(Statistic):
         """Compute a two-point statistic from sources."""
 
         assert self._ell_or_theta is not None
-        self.ell_or_theta_ = self._ell_or_theta.copy()
+        # This is read-only, so it can be shared rather than copied.
+        self.ell_or_theta_ = self._ell_or_theta
 
         tracers0 = self.source0.get_tracers(tools)
         tracers1 = self.source1.get_tracers(tools)
-        scale0 = self.source0.get_scale()
-        scale1 = self.source1.get_scale()
-
-        if self.ccl_kind == "cl":
-            self.ells = self.ell_or_theta_
-        else:
-            self.ells = _ell_for_xi(**self.ell_for_xi)
+        ccl_cosmo = tools.get_ccl_cosmology()
+        cosmo_hash = tools.get_ccl_cosmology_hash()
+        # All the tracer pairs share the same scale factor.
+        scale = self.source0.get_scale() * self.source1.get_scale()
+
+        if self.ccl_kind != "cl":
+            # ell_for_xi may have been changed since the last call. _ell_for_xi
+            # is memoized, so it only builds a new array when it was.
+            ells = _ell_for_xi(**self.ell_for_xi)
+            if ells is not self.ells:
+                self.ells = ells
+                self.cl_cache.clear()
+                self.xi_cache = None
+        assert self.ells is not None
 
         # TODO: we should not be adding a new instance variable outside of
         # __init__. Why is `self.cells` an instance variable rather than a
@@ -367,57 +461,60 @@ class TwoPoint(Statistic):
 
         # Loop over the tracers and compute all possible combinations
         # of them
+        is_auto_correlation = self.source0 is self.source1
         for tracer0 in tracers0:
+            name0 = tracer0.tracer_name
             for tracer1 in tracers1:
-                pk_name = f"{tracer0.field}:{tracer1.field}"
-                if (tracer0.tracer_name, tracer1.tracer_name) in self.cells:
+                name1 = tracer1.tracer_name
+                pair = (name0, name1)
+                if pair in self.cells:
                     # Already computed this combination, skipping
                     continue
-                pk = self.calculate_pk(pk_name, tools, tracer0, tracer1)
-
-                self.cells[(tracer0.tracer_name, tracer1.tracer_name)] = (
-                    _cached_angular_cl(
-                        tools.get_ccl_cosmology(),
-                        (tracer0.ccl_tracer, tracer1.ccl_tracer),
-                        tuple(self.ells.tolist()),
-                        p_of_k_a=pk,
-                    )
-                    * scale0
-                    * scale1
+                reversed_pair = (name1, name0)
+                if is_auto_correlation and reversed_pair in self.cells:
+                    # For an auto-correlation both orderings of a pair of tracers
+                    # have the same spectrum and the same scale.
+                    self.cells[pair] = self.cells[reversed_pair]
+                    continue
+
+                self.cells[pair] = scale * self.compute_cl(
+                    tools, ccl_cosmo, cosmo_hash, tracer0, tracer1
                 )
 
-        # Add up all the contributions to the cells
-        self.cells["total"] = np.array(sum(self.cells.values()))
+        # Add up all the contributions to the cells, accumulating in place into a
+        # copy of the first one.
+        contributions = iter(self.cells.values())
+        total = next(contributions).copy()
+        for cell in contributions:
+            total += cell
+        self.cells["total"] = total
         theory_vector = self.cells["total"]
 
         if not self.ccl_kind == "cl":
-            theory_vector = pyccl.correlation(
-                tools.get_ccl_cosmology(),
-                ell=self.ells,
-                C_ell=theory_vector,
-                theta=self.ell_or_theta_ / 60,
-                type=self.ccl_kind,
-            )
+            theory_vector = self.compute_xi(ccl_cosmo, cosmo_hash, theory_vector)
 
         if self.theory_window_function is not None:
             # TODO: There is no code in Firecrown, neither test nor example,
             # that exercises a theory window function in any way.
-            theory_interpolator = make_log_interpolator(
-                self.ell_or_theta_, theory_vector
-            )
+            assert self.window_interpolation is not None
             ell = self.theory_window_function.values
             # Deal with ell=0 and ell=1
-            theory_vector_interpolated = np.zeros(ell.size)
-            theory_vector_interpolated[2:] = theory_interpolator(ell[2:])
+            theory_vector_interpolated = np.empty(ell.size)
+            theory_vector_interpolated[:2] = 0.0
+            if np.all(theory_vector > 0):
+                # use log-log interpolation
+                theory_vector_interpolated[2:] = np.exp(
+                    self.window_interpolation @ np.log(theory_vector)
+                )
+            else:
+                theory_vector_interpolated[2:] = (
+                    self.window_interpolation @ theory_vector
+                )
 
-            theory_vector = np.einsum(
-                "lb, l -> b",
-                self.theory_window_function.weight,
-                theory_vector_interpolated,
-            )
-            self.ell_or_theta_ = np.einsum(
-                "lb, l -> b", self.theory_window_function.weight, ell
-            )
+            assert self.window_weight_t is not None
+            assert self.window_ell_or_theta is not None
+            theory_vector = self.window_weight_t @ theory_vector_interpolated
+            self.ell_or_theta_ = self.window_ell_or_theta
 
         self.predicted_statistic_ = TheoryVector.create(theory_vector)
 
@@ -425,6 +522,81 @@ class TwoPoint(Statistic):
 
         return TheoryVector.create(theory_vector)
 
+    def compute_cl(
+        self,
+        tools: ModelingTools,
+        ccl_cosmo: pyccl.Cosmology,
+        cosmo_hash: int,
+        tracer0: Tracer,
+        tracer1: Tracer,
+    ) -> npt.NDArray[np.float64]:
+        """Return the angular power spectrum of the two tracers at self.ells.
+
+        `ccl_cosmo` and `cosmo_hash` are the cosmology of `tools` and its hash,
+        passed in so that they are looked up once for all the tracer pairs.
+
+        The result is cached for each pair of tracer names. The cached value is
+        reused as long as the cosmology is unchanged and the sources returned the
+        same :python:`pyccl.Tracer` objects, which they do unless their
+        parameters changed. The ell values are not part of the cache key: the
+        cache is cleared whenever they are set."""
+        assert self.ells is not None
+        key = (tracer0.tracer_name, tracer1.tracer_name)
+        cached = self.cl_cache.get(key)
+        if (
+            cached is not None
+            and cached[0] == cosmo_hash
+            and cached[1] is tracer0.ccl_tracer
+            and cached[2] is tracer1.ccl_tracer
+        ):
+            return cached[3]
+
+        pk_name = f"{tracer0.field}:{tracer1.field}"
+        pk = self.calculate_pk(pk_name, tools, tracer0, tracer1)
+        cl = pyccl.angular_cl(
+            ccl_cosmo,
+            tracer0.ccl_tracer,
+            tracer1.ccl_tracer,
+            self.ells,
+            p_of_k_a=pk,
+        )
+        self.cl_cache[key] = (cosmo_hash, tracer0.ccl_tracer, tracer1.ccl_tracer, cl)
+        return cl
+
+    def compute_xi(
+        self,
+        ccl_cosmo: pyccl.Cosmology,
+        cosmo_hash: int,
+        cell: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        """Return the correlation function at self.theta_for_xi corresponding
+        to the angular power spectrum `cell` sampled at self.ells.
+
+        The transform is skipped, returning the previous result, when both the
+        cosmology and the angular power spectrum are unchanged since the last
+        call; this happens when only the parameters of other statistics change.
+        A copy of the cached result is returned, so that the results of
+        different calls never share memory.
+        """
+        assert self.theta_for_xi is not None
+        cached = self.xi_cache
+        if (
+            cached is not None
+            and cached[0] == cosmo_hash
+            and np.array_equal(cached[1], cell)
+        ):
+            return cached[2].copy()
+
+        xi = pyccl.correlation(
+            ccl_cosmo,
+            ell=self.ells,
+            C_ell=cell,
+            theta=self.theta_for_xi,
+            type=self.ccl_kind,
+        )
+        self.xi_cache = (cosmo_hash, cell.copy(), xi)
+        return xi
+
     def calculate_pk(
         self, pk_name: str, tools: ModelingTools, tracer0: Tracer, tracer1: Tracer
     ):
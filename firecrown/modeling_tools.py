@@ -19,6 +19,7 @@ class ModelingTools:
         pt_calculator: Optional[pyccl.nl_pt.EulerianPTCalculator] = None,
     ):
         self.ccl_cosmo: Optional[pyccl.Cosmology] = None
+        self.ccl_cosmo_hash: Optional[int] = None
         self.pt_calculator: Optional[pyccl.nl_pt.EulerianPTCalculator] = pt_calculator
         self.powerspectra: Dict[str, pyccl.Pk2D] = {}
 
@@ -66,6 +67,7 @@ class ModelingTools:
         if self.ccl_cosmo is not None:
             raise RuntimeError("Cosmology has already been set")
         self.ccl_cosmo = ccl_cosmo
+        self.ccl_cosmo_hash = hash(ccl_cosmo)
 
         if self.pt_calculator is not None:
             self.pt_calculator.update_ingredients(ccl_cosmo)
@@ -75,6 +77,7 @@ class ModelingTools:
         """Resets all CCL objects in ModelingTools."""
 
         self.ccl_cosmo = None
+        self.ccl_cosmo_hash = None
 
     def get_ccl_cosmology(self) -> pyccl.Cosmology:
         """Return the CCL cosmology object."""
@@ -83,6 +86,17 @@ class ModelingTools:
             raise RuntimeError("Cosmology has not been set")
         return self.ccl_cosmo
 
+    def get_ccl_cosmology_hash(self) -> int:
+        """Return the hash of the CCL cosmology object.
+
+        The hash is computed only once, when the cosmology is set by
+        :python:`prepare`, so this is a cheap way to detect whether the cosmology
+        has changed since some cached result was calculated."""
+
+        if self.ccl_cosmo_hash is None:
+            raise RuntimeError("Cosmology has not been set")
+        return self.ccl_cosmo_hash
+
     def get_pt_calculator(self) -> pyccl.nl_pt.EulerianPTCalculator:
         """Return the perturbation theory calculator object."""
 
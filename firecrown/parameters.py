@@ -3,8 +3,9 @@
 """
 
 from __future__ import annotations
-from typing import Iterable, List, Dict, Set, Tuple, Optional, Iterator, Sequence
+from typing import Iterable, List, Dict, FrozenSet, Tuple, Optional, Iterator, Sequence
 from abc import ABC, abstractmethod
+import functools
 
 
 def parameter_get_full_name(prefix: Optional[str], param: str) -> str:
@@ -30,6 +31,21 @@ def parameter_get_full_name(prefix: Optional[str], param: str) -> str:
     return param
 
 
+@functools.lru_cache(maxsize=None)
+def _parameter_get_lookup_name(
+    prefix: Optional[str], param: str, lower_case: bool
+) -> str:
+    """Return the key under which the parameter is stored in a ParamsMap.
+
+    The set of (prefix, param) pairs requested during a run is small and
+    fixed, so the full names are formed once and reused for every sample.
+    """
+    fullname = parameter_get_full_name(prefix, param)
+    if lower_case:
+        return fullname.lower()
+    return fullname
+
+
 class ParamsMap(Dict[str, float]):
     """A specialized Dict in which all keys are strings and values are floats.
 
@@ -58,15 +74,13 @@ class ParamsMap(Dict[str, float]):
         See parameter_get_full_name for rules on the forming of prefix and name.
         Raises a KeyError if the parameter is not found.
         """
-        fullname = parameter_get_full_name(prefix, param)
-        if self.lower_case:
-            fullname = fullname.lower()
-
-        if fullname in self.keys():
+        fullname = _parameter_get_lookup_name(prefix, param, self.lower_case)
+        try:
             return self[fullname]
-        raise KeyError(
-            f"Prefix `{prefix}`, param `{param}', key `{fullname}' not found."
-        )
+        except KeyError as exc:
+            raise KeyError(
+                f"Prefix `{prefix}`, param `{param}', key `{fullname}' not found."
+            ) from exc
 
 
 class RequiredParameters:
@@ -84,7 +98,7 @@ class RequiredParameters:
 
     def __init__(self, params_names: Iterable[str]):
         """Construct an instance from an Iterable yielding strings."""
-        self.params_names: Set[str] = set(params_names)
+        self.params_names: FrozenSet[str] = frozenset(params_names)
 
     def __add__(self, other: RequiredParameters):
         """Return a new RequiredParameters with the concatenated names.
@@ -107,11 +121,11 @@ class RequiredParameters:
         return self.params_names == other.params_names
 
     def get_params_names(self) -> Iterator[str]:
-        """Implement lazy iteration through the contained parameter names."""
-        params_names_set = set(self.params_names)
+        """Implement lazy iteration through the contained parameter names.
 
-        for name in params_names_set:
-            yield name
+        The names are stored in a frozenset, so they can be iterated directly
+        without a defensive copy."""
+        return iter(self.params_names)
 
 
 class DerivedParameter(ABC):
@@ -121,6 +135,8 @@ class DerivedParameter(ABC):
     by an Updatable object during a statistical analysis.
     """
 
+    __slots__ = ("section", "name")
+
     def __init__(self, section: str, name: str):
         """Constructs a new derived parameter."""
         self.section: str = section
@@ -142,6 +158,8 @@ class DerivedParameterScalar(DerivedParameter):
      by a float) computed by an Updatable object during a statistical analysis.
     """
 
+    __slots__ = ("val",)
+
     def __init__(self, section: str, name: str, val: float):
         super().__init__(section, name)
 
@@ -190,6 +208,24 @@ class DerivedParameterCollection:
             + list(other.derived_parameters.values())
         )
 
+    @classmethod
+    def concatenate(
+        cls, collections: Iterable[Optional[DerivedParameterCollection]]
+    ) -> DerivedParameterCollection:
+        """Return a new DerivedParameterCollection with the DerivedParameter objects
+        of all the given collections, in order.
+
+        None entries are skipped, as in the addition operator. This is equivalent
+        to adding up all the collections, but builds the result only once rather
+        than once per addition."""
+        result = cls([])
+        for collection in collections:
+            if collection is None:
+                continue
+            for derived_parameter in collection.derived_parameters.values():
+                result.add_required_parameter(derived_parameter)
+        return result
+
     def __eq__(self, other: object):
         """Compare two DerivedParameterCollection objects for equality.
 
@@ -1,6 +1,6 @@
 """Adds support for new data types to sacc."""
 
-from importlib import reload
+from typing import Tuple
 
 from astropy.table import Table
 
@@ -13,39 +13,24 @@ sacc.data_types.required_tags["cluster_mean_log_mass"] = []
 sacc.data_types.required_tags["cluster_shear"] = []
 
 sacc.data_types.standard_types = Namespace(*sacc.data_types.required_tags.keys())
+# The sacc package re-exports standard_types from sacc.data_types; re-bind it so
+# that sacc.standard_types also includes the types added above.
+sacc.standard_types = sacc.data_types.standard_types
 
 
-class BinZTracer(BaseTracer, tracer_type="bin_z"):  # type: ignore
-    """A tracer for a single redshift bin."""
+class _TableTracerMixin:
+    """Mixin for tracers that save all their instances in a single astropy table.
 
-    def __init__(self, name: str, lower: float, upper: float, **kwargs):
-        """
-        Create a tracer corresponding to a single redshift bin.
+    Each class using this mixin lists in :python:`table_columns` the attributes
+    stored as the columns of its table, one row per tracer.
+    """
 
-        :param name: The name of the tracer
-        :param lower: The lower bound of the redshift bin
-        :param upper: The upper bound of the redshift bin
-        """
-        super().__init__(name, **kwargs)
-        self.lower = lower
-        self.upper = upper
-
-    def __eq__(self, other) -> bool:
-        """Test for equality.  If :python:`other` is not a
-        :python:`BinZTracer`, then it is not equal to :python:`self`.
-        Otherwise, they are equal if names, and the z-range of the bins,
-        are equal."""
-        if not isinstance(other, BinZTracer):
-            return False
-        return (
-            self.name == other.name
-            and self.lower == other.lower
-            and self.upper == other.upper
-        )
+    tracer_type: str
+    table_columns: Tuple[str, ...]
 
     @classmethod
     def to_tables(cls, instance_list):
-        """Convert a list of BinZTracers to a single astropy table
+        """Convert a list of tracers to a single astropy table
 
         This is used when saving data to a file.
         One table is generated with the information for all the tracers.
@@ -53,17 +38,12 @@ class BinZTracer(BaseTracer, tracer_type="bin_z"):  # type: ignore
         :param instance_list: List of tracer instances
         :return: List with a single astropy table
         """
-
-        names = ["name", "quantity", "lower", "upper"]
-
-        cols = [
-            [obj.name for obj in instance_list],
-            [obj.quantity for obj in instance_list],
-            [obj.lower for obj in instance_list],
-            [obj.upper for obj in instance_list],
+        rows = [
+            tuple(getattr(obj, column) for column in cls.table_columns)
+            for obj in instance_list
         ]
 
-        table = Table(data=cols, names=names)
+        table = Table(rows=rows, names=cls.table_columns)
         table.meta["SACCTYPE"] = "tracer"
         table.meta["SACCCLSS"] = cls.tracer_type
         table.meta["EXTNAME"] = f"tracer:{cls.tracer_type}"
@@ -82,25 +62,26 @@ class BinZTracer(BaseTracer, tracer_type="bin_z"):  # type: ignore
         tracers = {}
 
         for table in table_list:
-            for row in table:
-                name = row["name"]
-                quantity = row["quantity"]
-                lower = row["lower"]
-                upper = row["upper"]
-                tracers[name] = cls(name, quantity=quantity, lower=lower, upper=upper)
+            columns = [table[column] for column in cls.table_columns]
+            for values in zip(*columns):
+                kwargs = dict(zip(cls.table_columns, values))
+                name = kwargs.pop("name")
+                tracers[name] = cls(name, **kwargs)  # type: ignore[call-arg]
         return tracers
 
 
-class BinLogMTracer(BaseTracer, tracer_type="bin_logM"):  # type: ignore
-    """A tracer for a single log-mass bin."""
+class BinZTracer(_TableTracerMixin, BaseTracer, tracer_type="bin_z"):  # type: ignore
+    """A tracer for a single redshift bin."""
+
+    table_columns = ("name", "quantity", "lower", "upper")
 
     def __init__(self, name: str, lower: float, upper: float, **kwargs):
         """
-        Create a tracer corresponding to a single log-mass bin.
+        Create a tracer corresponding to a single redshift bin.
 
         :param name: The name of the tracer
-        :param lower: The lower bound of the log-mass bin
-        :param upper: The upper bound of the log-mass bin
+        :param lower: The lower bound of the redshift bin
+        :param upper: The upper bound of the redshift bin
         """
         super().__init__(name, **kwargs)
         self.lower = lower
@@ -108,68 +89,58 @@ class BinLogMTracer(BaseTracer, tracer_type="bin_logM"):  # type: ignore
 
     def __eq__(self, other) -> bool:
         """Test for equality.  If :python:`other` is not a
-        :python:`BinLogMTracer`, then it is not equal to :python:`self`.
+        :python:`BinZTracer`, then it is not equal to :python:`self`.
         Otherwise, they are equal if names, and the z-range of the bins,
         are equal."""
-        if not isinstance(other, BinLogMTracer):
+        if not isinstance(other, BinZTracer):
             return False
-        return (
-            self.name == other.name
-            and self.lower == other.lower
-            and self.upper == other.upper
-        )
+        return self._key() == other._key()
 
-    @classmethod
-    def to_tables(cls, instance_list):
-        """Convert a list of BinLogMTracers to a single astropy table
+    def _key(self) -> Tuple[str, float, float]:
+        """Return the values compared by :python:`__eq__`."""
+        return (self.name, self.lower, self.upper)
 
-        This is used when saving data to a file.
-        One table is generated with the information for all the tracers.
 
-        :param instance_list: List of tracer instances
-        :return: List with a single astropy table
-        """
-
-        names = ["name", "quantity", "lower", "upper"]
-
-        cols = [
-            [obj.name for obj in instance_list],
-            [obj.quantity for obj in instance_list],
-            [obj.lower for obj in instance_list],
-            [obj.upper for obj in instance_list],
-        ]
-
-        table = Table(data=cols, names=names)
-        table.meta["SACCTYPE"] = "tracer"
-        table.meta["SACCCLSS"] = cls.tracer_type
-        table.meta["EXTNAME"] = f"tracer:{cls.tracer_type}"
-        return [table]
+class BinLogMTracer(
+    _TableTracerMixin, BaseTracer, tracer_type="bin_logM"  # type: ignore
+):
+    """A tracer for a single log-mass bin."""
 
-    @classmethod
-    def from_tables(cls, table_list):
-        """Convert an astropy table into a dictionary of tracers
+    table_columns = ("name", "quantity", "lower", "upper")
 
-        This is used when loading data from a file.
-        One tracer object is created for each "row" in each table.
+    def __init__(self, name: str, lower: float, upper: float, **kwargs):
+        """
+        Create a tracer corresponding to a single log-mass bin.
 
-        :param table_list: List of astropy tables
-        :return: Dictionary of tracers
+        :param name: The name of the tracer
+        :param lower: The lower bound of the log-mass bin
+        :param upper: The upper bound of the log-mass bin
         """
-        tracers = {}
+        super().__init__(name, **kwargs)
+        self.lower = lower
+        self.upper = upper
 
-        for table in table_list:
-            for row in table:
-                name = row["name"]
-                quantity = row["quantity"]
-                lower = row["lower"]
-                upper = row["upper"]
-                tracers[name] = cls(name, quantity=quantity, lower=lower, upper=upper)
-        return tracers
+    def __eq__(self, other) -> bool:
+        """Test for equality.  If :python:`other` is not a
+        :python:`BinLogMTracer`, then it is not equal to :python:`self`.
+        Otherwise, they are equal if names, and the z-range of the bins,
+        are equal."""
+        if not isinstance(other, BinLogMTracer):
+            return False
+        return self._key() == other._key()
+
+    def _key(self) -> Tuple[str, float, float]:
+        """Return the values compared by :python:`__eq__`."""
+        return (self.name, self.lower, self.upper)
 
 
-class BinRichnessTracer(BaseTracer, tracer_type="bin_richness"):  # type: ignore
+class BinRichnessTracer(
+    _TableTracerMixin, BaseTracer, tracer_type="bin_richness"  # type: ignore
+):
     """A tracer for a single richness bin."""
 
+    table_columns = ("name", "quantity", "lower", "upper")
+
     def __eq__(self, other) -> bool:
         """Test for equality. If :python:`other` is not a
         :python:`BinRichnessTracer`, then it is not equal to :python:`self`.
@@ -177,11 +148,11 @@ class BinRichnessTracer(BaseTracer, tracer_type="bin_richness"):  # type: ignore
         bins, are equal."""
         if not isinstance(other, BinRichnessTracer):
             return False
-        return (
-            self.name == other.name
-            and self.lower == other.lower
-            and self.upper == other.upper
-        )
+        return self._key() == other._key()
+
+    def _key(self) -> Tuple[str, float, float]:
+        """Return the values compared by :python:`__eq__`."""
+        return (self.name, self.lower, self.upper)
 
     def __init__(self, name: str, lower: float, upper: float, **kwargs):
         """
@@ -195,61 +166,14 @@ class BinRichnessTracer(BaseTracer, tracer_type="bin_richness"):  # type: ignore
         self.lower = lower
         self.upper = upper
 
-    @classmethod
-    def to_tables(cls, instance_list):
-        """Convert a list of BinZTracers to a list of astropy tables
-
-        This is used when saving data to a file.
-        One table is generated with the information for all the tracers.
 
-        :param instance_list: List of tracer instances
-        :return: List with a single astropy table
-        """
-        names = ["name", "quantity", "lower", "upper"]
-
-        cols = [
-            [obj.name for obj in instance_list],
-            [obj.quantity for obj in instance_list],
-            [obj.lower for obj in instance_list],
-            [obj.upper for obj in instance_list],
-        ]
-
-        table = Table(data=cols, names=names)
-        table.meta["SACCTYPE"] = "tracer"
-        table.meta["SACCCLSS"] = cls.tracer_type
-        table.meta["EXTNAME"] = f"tracer:{cls.tracer_type}"
-        return [table]
-
-    @classmethod
-    def from_tables(cls, table_list):
-        """Convert an astropy table into a dictionary of tracers
-
-        This is used when loading data from a file.
-        One tracer object is created for each "row" in each table.
-
-        :param table_list: List of astropy tables
-        :return: Dictionary of tracers
-        """
-        tracers = {}
-
-        for table in table_list:
-            for row in table:
-                name = row["name"]
-                quantity = row["quantity"]
-                lower = row["lower"]
-                upper = row["upper"]
-                tracers[name] = cls(
-                    name,
-                    quantity=quantity,
-                    lower=lower,
-                    upper=upper,
-                )
-        return tracers
-
-
-class BinRadiusTracer(BaseTracer, tracer_type="bin_radius"):  # type: ignore
+class BinRadiusTracer(
+    _TableTracerMixin, BaseTracer, tracer_type="bin_radius"  # type: ignore
+):
     """A tracer for a single radial bin."""
 
+    table_columns = ("name", "quantity", "lower", "upper", "center")
+
     def __eq__(self, other) -> bool:
         """Test for equality. If :python:`other` is not a
         :python:`BinRadiusTracer`, then it is not equal to :python:`self`.
@@ -257,12 +181,11 @@ class BinRadiusTracer(BaseTracer, tracer_type="bin_radius"):  # type: ignore
         bins, are equal."""
         if not isinstance(other, BinRadiusTracer):
             return False
-        return (
-            self.name == other.name
-            and self.lower == other.lower
-            and self.center == other.center
-            and self.upper == other.upper
-        )
+        return self._key() == other._key()
+
+    def _key(self) -> Tuple[str, float, float, float]:
+        """Return the values compared by :python:`__eq__`."""
+        return (self.name, self.lower, self.center, self.upper)
 
     def __init__(self, name: str, lower: float, upper: float, center: float, **kwargs):
         """
@@ -281,72 +204,25 @@ class BinRadiusTracer(BaseTracer, tracer_type="bin_radius"):  # type: ignore
         self.upper = upper
         self.center = center
 
-    @classmethod
-    def to_tables(cls, instance_list):
-        """Convert a list of BinRadiusTracers to a single astropy table
-
-        This is used when saving data to a file.
-        One table is generated with the information for all the tracers.
-
-        :param instance_list: List of tracer instances
-        :return: List with a single astropy table
-        """
-
-        names = ["name", "quantity", "lower", "upper", "center"]
-
-        cols = [
-            [obj.name for obj in instance_list],
-            [obj.quantity for obj in instance_list],
-            [obj.lower for obj in instance_list],
-            [obj.upper for obj in instance_list],
-            [obj.center for obj in instance_list],
-        ]
-
-        table = Table(data=cols, names=names)
-        table.meta["SACCTYPE"] = "tracer"
-        table.meta["SACCCLSS"] = cls.tracer_type
-        table.meta["EXTNAME"] = f"tracer:{cls.tracer_type}"
-        return [table]
-
-    @classmethod
-    def from_tables(cls, table_list):
-        """Convert an astropy table into a dictionary of tracers
-
-        This is used when loading data from a file.
-        One tracer object is created for each "row" in each table.
-
-        :param table_list: List of astropy tables
-        :return: Dictionary of tracers
-        """
-        tracers = {}
-
-        for table in table_list:
-            for row in table:
-                name = row["name"]
-                quantity = row["quantity"]
-                lower = row["lower"]
-                upper = row["upper"]
-                center = row["center"]
-                tracers[name] = cls(
-                    name,
-                    quantity=quantity,
-                    lower=lower,
-                    upper=upper,
-                    center=center,
-                )
-        return tracers
-
 
-class ClusterSurveyTracer(BaseTracer, tracer_type="cluster_survey"):  # type: ignore
+class ClusterSurveyTracer(
+    _TableTracerMixin, BaseTracer, tracer_type="cluster_survey"  # type: ignore
+):
     """A tracer for the survey definition."""
 
+    table_columns = ("name", "quantity", "sky_area")
+
     def __eq__(self, other) -> bool:
         """Test for equality. If :python:`other` is not a
         :python:`ClusterSurveyTracer`, then it is not equal to :python:`self`.
         Otherwise, they are equal if names and the sky-areas are equal."""
         if not isinstance(other, ClusterSurveyTracer):
             return False
-        return self.name == other.name and self.sky_area == other.sky_area
+        return self._key() == other._key()
+
+    def _key(self) -> Tuple[str, float]:
+        """Return the values compared by :python:`__eq__`."""
+        return (self.name, self.sky_area)
 
     def __init__(self, name: str, sky_area: float, **kwargs):
         """
@@ -357,54 +233,3 @@ class ClusterSurveyTracer(BaseTracer, tracer_type="cluster_survey"):  # type: ig
         """
         super().__init__(name, **kwargs)
         self.sky_area = sky_area
-
-    @classmethod
-    def to_tables(cls, instance_list):
-        """Convert a list of ClusterSurveyTracer to a list of astropy tables
-
-        This is used when saving data to a file.
-        One table is generated with the information for all the tracers.
-
-        :param instance_list: List of tracer instances
-        :return: List of astropy tables with one table
-        """
-        names = ["name", "quantity", "sky_area"]
-
-        cols = [
-            [obj.name for obj in instance_list],
-            [obj.quantity for obj in instance_list],
-            [obj.sky_area for obj in instance_list],
-        ]
-
-        table = Table(data=cols, names=names)
-        table.meta["SACCTYPE"] = "tracer"
-        table.meta["SACCCLSS"] = cls.tracer_type
-        table.meta["EXTNAME"] = f"tracer:{cls.tracer_type}"
-        return [table]
-
-    @classmethod
-    def from_tables(cls, table_list):
-        """Convert an astropy table into a dictionary of tracers
-
-        This is used when loading data from a file.
-        One tracer object is created for each "row" in each table.
-
-        :param table_list: List of astropy tables
-        :return: Dictionary of tracers
-        """
-        tracers = {}
-
-        for table in table_list:
-            for row in table:
-                name = row["name"]
-                quantity = row["quantity"]
-                sky_area = row["sky_area"]
-                tracers[name] = cls(
-                    name,
-                    quantity=quantity,
-                    sky_area=sky_area,
-                )
-        return tracers
-
-
-reload(sacc)
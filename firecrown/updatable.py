@@ -288,15 +288,13 @@ class UpdatableCollection(UserList):
     @final
     def get_derived_parameters(self) -> Optional[DerivedParameterCollection]:
         """Get all derived parameters if any."""
-        has_any_derived = False
-        derived_parameters = DerivedParameterCollection([])
+        derived_parameters_list: List[DerivedParameterCollection] = []
         for updatable in self:
             derived_parameters0 = updatable.get_derived_parameters()
             if derived_parameters0 is not None:
-                derived_parameters = derived_parameters + derived_parameters0
-                has_any_derived = True
-        if has_any_derived:
-            return derived_parameters
+                derived_parameters_list.append(derived_parameters0)
+        if len(derived_parameters_list) > 0:
+            return DerivedParameterCollection.concatenate(derived_parameters_list)
         return None
 
     def append(self, item: Updatable) -> None:
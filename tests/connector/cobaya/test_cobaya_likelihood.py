@@ -0,0 +1,22 @@
+"""Unit tests for the Cobaya likelihood connector."""
+
+import pytest
+
+from firecrown.connector.cobaya.likelihood import LikelihoodConnector
+
+
+@pytest.fixture(name="likelihood_connector")
+def fixture_likelihood_connector() -> LikelihoodConnector:
+    """Return a LikelihoodConnector for a likelihood without parameters."""
+    return LikelihoodConnector({"firecrownIni": "tests/likelihood/lkdir/lkscript.py"})
+
+
+def test_get_requirements(likelihood_connector):
+    requirements = likelihood_connector.get_requirements()
+    assert requirements == {"pyccl": None}
+
+
+def test_get_requirements_returns_a_copy(likelihood_connector):
+    requirements = likelihood_connector.get_requirements()
+    requirements["camb"] = None
+    assert likelihood_connector.get_requirements() == {"pyccl": None}
@@ -27,3 +27,11 @@ def test_parameterless_module_construction(minimal_module_config):
     introduce any new parameters."""
     module = FirecrownLikelihood(minimal_module_config)
     assert module.sampling_sections == []
+    assert not module.debug_datablock
+
+
+def test_module_construction_with_debug_datablock(minimal_module_config):
+    """Make sure the `debug_datablock` option is read from the configuration."""
+    minimal_module_config.put_bool("module_options", "debug_datablock", True)
+    module = FirecrownLikelihood(minimal_module_config)
+    assert module.debug_datablock
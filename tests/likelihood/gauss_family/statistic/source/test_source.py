@@ -3,13 +3,63 @@ Tests for the module firecrown.likelihood.gauss_family.statistic.source.source.
 """
 import pytest
 import pyccl
-from firecrown.likelihood.gauss_family.statistic.source.source import Tracer
+import sacc
+
+from firecrown import parameters
+from firecrown.likelihood.gauss_family.statistic.source.source import Source, Tracer
+from firecrown.modeling_tools import ModelingTools
+from firecrown.parameters import (
+    DerivedParameterCollection,
+    ParamsMap,
+    RequiredParameters,
+)
 
 
 class TrivialTracer(Tracer):
     """This is the most trivial possible subclass of Tracer."""
 
 
+class CountingSource(Source):
+    """A Source with one parameter that counts how often it creates tracers."""
+
+    def __init__(self):
+        super().__init__()
+        self.sacc_tracer = "src0"
+        self.bias = parameters.create()
+        self.n_created = 0
+
+    def _read(self, sacc_data: sacc.Sacc):
+        pass
+
+    def _reset_source(self):
+        pass
+
+    def _required_parameters(self) -> RequiredParameters:
+        return RequiredParameters([])
+
+    def _get_derived_parameters(self) -> DerivedParameterCollection:
+        return DerivedParameterCollection([])
+
+    def get_scale(self) -> float:
+        return 1.0
+
+    def create_tracers(self, tools: ModelingTools):
+        self.n_created += 1
+        return [Tracer(pyccl.Tracer())], None
+
+
+@pytest.fixture(name="tools")
+def fixture_tools() -> ModelingTools:
+    tools = ModelingTools()
+    tools.prepare(pyccl.CosmologyVanillaLCDM())
+    return tools
+
+
+def update_source(source: Source, bias: float):
+    source.reset()
+    source.update(ParamsMap({"src0_bias": bias}))
+
+
 @pytest.fixture(name="empty_pyccl_tracer")
 def fixture_empty_pyccl_tracer():
     return pyccl.Tracer()
@@ -42,3 +92,28 @@ def test_tracer_construction_with_name(empty_pyccl_tracer):
     assert named.halo_2pt is None
     assert not named.has_pt
     assert not named.has_hm
+
+
+def test_source_tracers_rebuilt_when_parameters_change(tools):
+    source = CountingSource()
+    update_source(source, -1.0)
+    tracers = source.get_tracers(tools)
+    assert source.get_tracers(tools) is tracers
+    assert source.n_created == 1
+
+    # hash(-1.0) == hash(-2.0), so the cache must compare the values themselves.
+    update_source(source, -2.0)
+    assert source.get_tracers(tools) is not tracers
+    assert source.n_created == 2
+
+
+def test_source_tracers_rebuilt_after_read(tools):
+    source = CountingSource()
+    update_source(source, 1.0)
+    tracers = source.get_tracers(tools)
+    assert source.n_created == 1
+
+    source.read(sacc.Sacc())
+    update_source(source, 1.0)
+    assert source.get_tracers(tools) is not tracers
+    assert source.n_created == 2
@@ -0,0 +1,44 @@
+"""
+Tests for the module firecrown.likelihood.gauss_family.statistic.source.weak_lensing.
+"""
+import numpy as np
+import pyccl
+import pyccl.nl_pt
+
+import firecrown.likelihood.gauss_family.statistic.source.weak_lensing as wl
+from firecrown.modeling_tools import ModelingTools
+from firecrown.parameters import ParamsMap
+
+
+def test_tatt_alignment_cached_norms_match_translate_ia_norm():
+    tools = ModelingTools()
+    tools.prepare(pyccl.CosmologyVanillaLCDM())
+    z = np.linspace(0.05, 2.0, 40)
+    tracer_arg = wl.WeakLensingArgs(scale=1.0, z=z, dndz=np.ones_like(z), ia_bias=None)
+    systematic = wl.TattAlignmentSystematic()
+
+    # The second update reuses the normalizations cached by the first one.
+    cache_entries = []
+    for a_1, a_2, a_d in ((1.5, -0.7, 0.3), (-2.0, 0.4, 1.1)):
+        systematic.reset()
+        systematic.update(ParamsMap({"ia_a_1": a_1, "ia_a_2": a_2, "ia_a_d": a_d}))
+        result = systematic.apply(tools, tracer_arg)
+
+        c_1, c_d, c_2 = pyccl.nl_pt.translate_IA_norm(
+            tools.get_ccl_cosmology(),
+            z=z,
+            a1=a_1,
+            a1delta=a_d,
+            a2=a_2,
+            Om_m2_for_c2=False,
+        )
+        assert result.ia_pt_c_1 is not None
+        assert result.ia_pt_c_d is not None
+        assert result.ia_pt_c_2 is not None
+        assert np.allclose(result.ia_pt_c_1[1], c_1, atol=0, rtol=1e-12)
+        assert np.allclose(result.ia_pt_c_d[1], c_d, atol=0, rtol=1e-12)
+        assert np.allclose(result.ia_pt_c_2[1], c_2, atol=0, rtol=1e-12)
+        cache_entries.append(systematic.unit_norms_cache)
+
+    assert cache_entries[0] is not None
+    assert cache_entries[1] is cache_entries[0]
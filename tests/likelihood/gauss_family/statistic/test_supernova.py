@@ -0,0 +1,82 @@
+"""
+Tests for the Supernova module.
+"""
+import numpy as np
+import pytest
+
+import pyccl
+import sacc
+
+from firecrown.likelihood.gauss_family.statistic.supernova import Supernova
+from firecrown.likelihood.gauss_family.statistic.statistic import DataVector
+from firecrown.modeling_tools import ModelingTools
+from firecrown.parameters import ParamsMap
+
+
+@pytest.fixture(name="sn_sacc_data")
+def fixture_sn_sacc_data() -> sacc.Sacc:
+    """Return a small sacc.Sacc object holding supernova distance moduli."""
+    result = sacc.Sacc()
+    result.add_tracer("misc", "sn_ddf_sample")
+    for z, mu in [(0.1, 38.3), (0.5, 42.3), (1.0, 44.1)]:
+        result.add_data_point("supernova_distance_mu", ("sn_ddf_sample",), mu, z=z)
+    result.add_covariance(np.diag([0.01, 0.02, 0.03]))
+    return result
+
+
+def test_supernova_read(sn_sacc_data: sacc.Sacc):
+    statistic = Supernova(sacc_tracer="sn_ddf_sample")
+    statistic.read(sn_sacc_data)
+
+    assert statistic.a is not None
+    assert np.allclose(statistic.a, 1.0 / (1.0 + np.array([0.1, 0.5, 1.0])))
+    data_vector = statistic.get_data_vector()
+    assert isinstance(data_vector, DataVector)
+    assert np.allclose(data_vector, [38.3, 42.3, 44.1])
+    assert np.array_equal(statistic.sacc_indices, np.arange(3))
+    assert statistic.sacc_indices.dtype == np.int64
+
+
+def test_supernova_data_vector_before_read():
+    statistic = Supernova(sacc_tracer="sn_ddf_sample")
+    assert statistic.data_vector is None
+    with pytest.raises(AssertionError):
+        _ = statistic.get_data_vector()
+
+
+def compute_with_m(statistic: Supernova, tools: ModelingTools, m: float):
+    """Update the statistic with the given shift M and compute its theory vector."""
+    statistic.reset()
+    statistic.update(ParamsMap({"sn_ddf_sample_M": m}))
+    return statistic.compute_theory_vector(tools)
+
+
+def test_supernova_distance_modulus_cache(sn_sacc_data: sacc.Sacc):
+    statistic = Supernova(sacc_tracer="sn_ddf_sample")
+    statistic.read(sn_sacc_data)
+    cosmo = pyccl.CosmologyVanillaLCDM()
+    tools = ModelingTools()
+    tools.prepare(cosmo)
+    expected_mu = pyccl.distance_modulus(cosmo, statistic.a)
+
+    first = compute_with_m(statistic, tools, -19.3)
+    assert np.allclose(first, expected_mu - 19.3)
+    entry = statistic.mu_cache
+    assert entry is not None
+
+    # Same cosmology: the distance modulus is reused, with the new M applied.
+    second = compute_with_m(statistic, tools, -19.0)
+    assert statistic.mu_cache is entry
+    assert np.allclose(second, expected_mu - 19.0)
+    assert np.allclose(first, expected_mu - 19.3)
+
+    # New cosmology: the distance modulus is recomputed.
+    other_cosmo = pyccl.Cosmology(
+        Omega_c=0.3, Omega_b=0.05, h=0.7, n_s=0.96, sigma8=0.8
+    )
+    other_tools = ModelingTools()
+    other_tools.prepare(other_cosmo)
+    third = compute_with_m(statistic, other_tools, -19.0)
+    assert statistic.mu_cache is not entry
+    assert np.allclose(third, pyccl.distance_modulus(other_cosmo, statistic.a) - 19.0)
+    assert not np.allclose(third, second)
@@ -1,14 +1,25 @@
 """
 Tests for the TwoPoint module.
 """
+import os
+
 import numpy as np
 import pytest
+import pyccl
+import sacc
 
 from firecrown.modeling_tools import ModelingTools
+from firecrown.parameters import ParamsMap
 from firecrown.likelihood.gauss_family.statistic.source.number_counts import (
     NumberCounts,
 )
-from firecrown.likelihood.gauss_family.statistic.two_point import _ell_for_xi, TwoPoint
+from firecrown.likelihood.gauss_family.statistic.two_point import (
+    _ell_for_xi,
+    _generate_ell_or_theta,
+    make_log_interpolation_matrix,
+    make_log_interpolator,
+    TwoPoint,
+)
 
 
 @pytest.fixture(name="source_0")
@@ -23,6 +34,54 @@ def fixture_tools() -> ModelingTools:
     return ModelingTools()
 
 
+@pytest.fixture(name="sacc_data", scope="module")
+def fixture_sacc_data() -> sacc.Sacc:
+    """Return the DES Y1 3x2pt SACC data, which the tests only read from."""
+    saccfile = os.path.join(
+        os.path.split(__file__)[0],
+        "../../../../examples/des_y1_3x2pt/des_y1_3x2pt_sacc_data.fits",
+    )
+    return sacc.Sacc.load_fits(saccfile)
+
+
+@pytest.fixture(name="lens0_source")
+def fixture_lens0_source() -> NumberCounts:
+    """Return a NumberCounts source for the lens0 tracer of the SACC data."""
+    return NumberCounts(sacc_tracer="lens0")
+
+
+def make_tools(sigma8: float = 0.81) -> ModelingTools:
+    """Return a ModelingTools object prepared for a LCDM cosmology."""
+    tools = ModelingTools()
+    tools.prepare(
+        pyccl.Cosmology(Omega_c=0.25, Omega_b=0.05, h=0.67, n_s=0.96, sigma8=sigma8)
+    )
+    return tools
+
+
+def compute_with_bias(
+    statistic: TwoPoint, tools: ModelingTools, bias: float
+) -> np.ndarray:
+    """Update the statistic with the given lens0 bias and compute its theory
+    vector."""
+    statistic.reset()
+    statistic.update(ParamsMap({"lens0_bias": bias}))
+    return statistic.compute_theory_vector(tools)
+
+
+def make_cl_statistic(source: NumberCounts, sacc_data: sacc.Sacc) -> TwoPoint:
+    """Return a read galaxy_density_cl statistic, on generated ell values since
+    the SACC data have no harmonic-space data."""
+    statistic = TwoPoint(
+        "galaxy_density_cl",
+        source,
+        source,
+        ell_or_theta={"minimum": 10, "maximum": 1000, "n": 5, "binning": "log"},
+    )
+    statistic.read(sacc_data)
+    return statistic
+
+
 def test_ell_for_xi_no_rounding():
     res = _ell_for_xi(minimum=0, midpoint=5, maximum=80, n_log=5)
     expected = np.array([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 10.0, 20.0, 40.0, 80.0])
@@ -36,6 +95,39 @@ def test_ell_for_xi_doing_rounding():
     assert np.allclose(expected, res)
 
 
+def test_ell_for_xi_is_cached_and_read_only():
+    res = _ell_for_xi(minimum=1, midpoint=3, maximum=100, n_log=5)
+    assert _ell_for_xi(minimum=1, midpoint=3, maximum=100, n_log=5) is res
+    assert not res.flags.writeable
+    with pytest.raises(ValueError):
+        res[0] = 0.0
+
+
+def test_generate_ell_or_theta_log_binning():
+    res = _generate_ell_or_theta(minimum=1.0, maximum=100.0, n=2, binning="log")
+    assert np.allclose(res, [np.sqrt(10.0), np.sqrt(1000.0)])
+
+
+def test_generate_ell_or_theta_lin_binning():
+    res = _generate_ell_or_theta(minimum=0.0, maximum=10.0, n=5, binning="lin")
+    assert np.allclose(res, [1.0, 3.0, 5.0, 7.0, 9.0])
+
+
+def test_log_interpolation_matrix_matches_interpolator():
+    x = np.geomspace(2.0, 1000.0, 60)
+    x_new = np.linspace(3.0, 900.0, 40)
+    matrix = make_log_interpolation_matrix(x, x_new)
+    assert matrix.shape == (40, 60)
+
+    y = x**-1.3
+    expected = make_log_interpolator(x, y)(x_new)
+    assert np.allclose(np.exp(matrix @ np.log(y)), expected)
+
+    y = np.sin(np.log(x))
+    expected = make_log_interpolator(x, y)(x_new)
+    assert np.allclose(matrix @ y, expected)
+
+
 def test_compute_theory_vector(source_0: NumberCounts):
     # To create the TwoPoint object we need at least one source.
     statistic = TwoPoint("galaxy_density_xi", source_0, source_0)
@@ -45,3 +137,145 @@ def test_compute_theory_vector(source_0: NumberCounts):
     # into the correct state.
     # prediction = statistic.compute_theory_vector(tools)
     # assert isinstance(prediction, TheoryVector)
+
+
+def test_compute_theory_vector_does_not_modify_earlier_results(
+    lens0_source: NumberCounts, sacc_data: sacc.Sacc
+):
+    statistic = make_cl_statistic(lens0_source, sacc_data)
+    tools = make_tools()
+
+    first = compute_with_bias(statistic, tools, 1.0)
+    first_cells = statistic.cells
+    expected = np.array(first, copy=True)
+    expected_cells = {key: cell.copy() for key, cell in first_cells.items()}
+
+    second = compute_with_bias(statistic, tools, 2.0)
+    assert np.array_equal(first, expected)
+    for key, cell in first_cells.items():
+        assert np.array_equal(cell, expected_cells[key])
+    # The galaxy spectrum scales with the square of the bias.
+    assert np.allclose(second, 4.0 * expected)
+
+
+def test_ell_for_xi_defaults(source_0: NumberCounts):
+    statistic = TwoPoint(
+        "galaxy_density_xi", source_0, source_0, ell_for_xi={"n_log": 10}
+    )
+    assert statistic.ell_for_xi == {
+        "minimum": 2,
+        "midpoint": 50,
+        "maximum": 6e4,
+        "n_log": 10,
+    }
+
+
+def test_compute_cl_cache_hit_when_nothing_changes(
+    lens0_source: NumberCounts, sacc_data: sacc.Sacc
+):
+    statistic = make_cl_statistic(lens0_source, sacc_data)
+    tools = make_tools()
+
+    first = compute_with_bias(statistic, tools, 1.0)
+    entries = dict(statistic.cl_cache)
+    assert len(entries) == 1
+
+    second = compute_with_bias(statistic, tools, 1.0)
+    for key, entry in entries.items():
+        assert statistic.cl_cache[key] is entry
+    assert np.array_equal(first, second)
+
+
+def test_compute_cl_cache_miss_when_parameters_change(
+    lens0_source: NumberCounts, sacc_data: sacc.Sacc
+):
+    statistic = make_cl_statistic(lens0_source, sacc_data)
+    tools = make_tools()
+
+    first = compute_with_bias(statistic, tools, 1.0)
+    entries = dict(statistic.cl_cache)
+
+    second = compute_with_bias(statistic, tools, 2.0)
+    for key, entry in entries.items():
+        assert statistic.cl_cache[key] is not entry
+    assert np.allclose(second, 4.0 * first)
+
+
+def test_compute_cl_cache_miss_when_cosmology_changes(
+    lens0_source: NumberCounts, sacc_data: sacc.Sacc
+):
+    statistic = make_cl_statistic(lens0_source, sacc_data)
+
+    first = compute_with_bias(statistic, make_tools(sigma8=0.81), 1.0)
+    entries = dict(statistic.cl_cache)
+
+    second = compute_with_bias(statistic, make_tools(sigma8=0.9), 1.0)
+    for key, entry in entries.items():
+        assert statistic.cl_cache[key] is not entry
+    assert not np.allclose(second, first)
+
+
+def make_xi_statistic(source: NumberCounts, sacc_data: sacc.Sacc) -> TwoPoint:
+    """Return a read galaxy_density_xi statistic, using only a couple of ells for
+    the real-space integration."""
+    statistic = TwoPoint(
+        "galaxy_density_xi",
+        source,
+        source,
+        ell_for_xi={"minimum": 2, "midpoint": 5, "maximum": 6e4, "n_log": 10},
+    )
+    statistic.read(sacc_data)
+    return statistic
+
+
+def test_compute_xi_cache(lens0_source: NumberCounts, sacc_data: sacc.Sacc):
+    statistic = make_xi_statistic(lens0_source, sacc_data)
+    tools = make_tools()
+
+    first = compute_with_bias(statistic, tools, 1.0)
+    expected = np.array(first, copy=True)
+    entry = statistic.xi_cache
+    assert entry is not None
+
+    # Unchanged cells: the correlation function is reused, but not shared.
+    second = compute_with_bias(statistic, tools, 1.0)
+    assert statistic.xi_cache is entry
+    assert np.array_equal(second, expected)
+    assert not np.shares_memory(second, first)
+
+    # Changed cells: the correlation function is recomputed.
+    third = compute_with_bias(statistic, tools, 2.0)
+    assert statistic.xi_cache is not entry
+    assert np.array_equal(first, expected)
+    assert np.allclose(third, 4.0 * expected)
+
+
+def test_ell_for_xi_changed_in_place_after_read(
+    lens0_source: NumberCounts, sacc_data: sacc.Sacc
+):
+    statistic = make_xi_statistic(lens0_source, sacc_data)
+    tools = make_tools()
+    assert statistic.ells is not None
+    assert statistic.ells.size == 13
+    first = compute_with_bias(statistic, tools, 1.0)
+
+    statistic.ell_for_xi["n_log"] = 20
+    second = compute_with_bias(statistic, tools, 1.0)
+    assert statistic.ells.size == 23
+    assert statistic.xi_cache is not None
+    assert statistic.xi_cache[1].size == 23
+    assert second.shape == first.shape
+
+
+def test_ell_for_xi_replaced_after_read(
+    lens0_source: NumberCounts, sacc_data: sacc.Sacc
+):
+    statistic = make_xi_statistic(lens0_source, sacc_data)
+    tools = make_tools()
+    _ = compute_with_bias(statistic, tools, 1.0)
+
+    statistic.ell_for_xi = {"minimum": 2, "midpoint": 10, "maximum": 6e4, "n_log": 4}
+    _ = compute_with_bias(statistic, tools, 1.0)
+    assert statistic.ells is not None
+    assert statistic.ells.size == 12
+    assert np.array_equal(statistic.ells[:8], np.arange(2.0, 10.0))
@@ -2,7 +2,6 @@
 
 from typing import Any, Dict
 import itertools
-import math
 
 import pytest
 import pyccl as ccl
@@ -17,7 +16,7 @@ from firecrown.models.cluster_redshift_spec import ClusterRedshiftSpec
 from firecrown.parameters import ParamsMap
 
 
-@pytest.fixture(name="ccl_cosmo")
+@pytest.fixture(name="ccl_cosmo", scope="module")
 def fixture_ccl_cosmo():
     """Fixture for a CCL cosmology object."""
 
@@ -26,7 +25,7 @@ def fixture_ccl_cosmo():
     )
 
 
-@pytest.fixture(name="parameters")
+@pytest.fixture(name="parameters", scope="module")
 def fixture_parameters():
     """Fixture for a parameter map."""
 
@@ -43,50 +42,54 @@ def fixture_parameters():
     return parameters
 
 
-@pytest.fixture(name="z_args")
-def fixture_cluster_z_args(parameters):
-    """Fixture for cluster redshifts."""
-    z_bins = np.array([0.2000146, 0.31251036, 0.42500611, 0.53750187, 0.64999763])
+@pytest.fixture(name="cluster_z", scope="module")
+def fixture_cluster_z(parameters):
+    """Fixture for the cluster redshift object."""
     cluster_z = ClusterRedshiftSpec()
-    assert isinstance(cluster_z, ClusterRedshift)
-
-    z_args = cluster_z.gen_bins_by_array(z_bins)
-
     cluster_z.update(parameters)
+    return cluster_z
 
-    return z_args
 
+@pytest.fixture(name="z_args", scope="module")
+def fixture_cluster_z_args(cluster_z):
+    """Fixture for cluster redshifts."""
+    z_bins = np.array([0.2000146, 0.31251036, 0.42500611, 0.53750187, 0.64999763])
+    return cluster_z.gen_bins_by_array(z_bins)
 
-@pytest.fixture(name="logM_args")
-def fixture_cluster_mass_logM_args(parameters):
-    """Fixture for cluster masses."""
-    logM_bins = np.array([13.0, 13.5, 14.0, 14.5, 15.0])
-    cluster_mass_t = ClusterMassTrue()
-    assert isinstance(cluster_mass_t, ClusterMass)
 
-    logM_args = cluster_mass_t.gen_bins_by_array(logM_bins)
+@pytest.fixture(name="cluster_mass_t", scope="module")
+def fixture_cluster_mass_t(parameters):
+    """Fixture for the true cluster mass object."""
+    cluster_mass_t = ClusterMassTrue()
     cluster_mass_t.update(parameters)
+    return cluster_mass_t
 
-    return logM_args
 
-
-@pytest.fixture(name="rich_args")
-def fixture_cluster_mass_rich_args(parameters):
+@pytest.fixture(name="logM_args", scope="module")
+def fixture_cluster_mass_logM_args(cluster_mass_t):
     """Fixture for cluster masses."""
+    logM_bins = np.array([13.0, 13.5, 14.0, 14.5, 15.0])
+    return cluster_mass_t.gen_bins_by_array(logM_bins)
+
+
+@pytest.fixture(name="cluster_mass_r", scope="module")
+def fixture_cluster_mass_r(parameters):
+    """Fixture for the richness cluster mass proxy object."""
     pivot_mass = 14.0
     pivot_redshift = 0.6
-    proxy_bins = np.array([0.45805137, 0.81610273, 1.1741541, 1.53220547, 1.89025684])
-
     cluster_mass_r = ClusterMassRich(pivot_mass, pivot_redshift)
-    assert isinstance(cluster_mass_r, ClusterMass)
-
-    rich_args = cluster_mass_r.gen_bins_by_array(proxy_bins)
     cluster_mass_r.update(parameters)
+    return cluster_mass_r
 
-    return rich_args
 
+@pytest.fixture(name="rich_args", scope="module")
+def fixture_cluster_mass_rich_args(cluster_mass_r):
+    """Fixture for cluster masses."""
+    proxy_bins = np.array([0.45805137, 0.81610273, 1.1741541, 1.53220547, 1.89025684])
+    return cluster_mass_r.gen_bins_by_array(proxy_bins)
 
-@pytest.fixture(name="cluster_abundance")
+
+@pytest.fixture(name="cluster_abundance", scope="module")
 def fixture_cluster_abundance(parameters):
     """Fixture for cluster objects."""
 
@@ -96,18 +99,27 @@ def fixture_cluster_abundance(parameters):
     sky_area = 489
 
     cluster_abundance = ClusterAbundance(hmd_200, hmf_name, hmf_args, sky_area)
-    assert isinstance(cluster_abundance, ClusterAbundance)
-
     cluster_abundance.update(parameters)
 
     return cluster_abundance
 
 
 def test_initialize_objects(
-    ccl_cosmo: ccl.Cosmology, cluster_abundance, z_args, logM_args, rich_args
+    ccl_cosmo: ccl.Cosmology,
+    cluster_abundance,
+    cluster_z,
+    cluster_mass_t,
+    cluster_mass_r,
+    z_args,
+    logM_args,
+    rich_args,
 ):
     """Test initialization of cluster objects."""
 
+    assert isinstance(cluster_z, ClusterRedshift)
+    assert isinstance(cluster_mass_t, ClusterMass)
+    assert isinstance(cluster_mass_r, ClusterMass)
+
     for z_arg in z_args:
         assert isinstance(z_arg, ClusterRedshiftArgument)
 
@@ -126,12 +138,13 @@ def test_cluster_mass_function_compute(
 ):
     """Test cluster mass function computations."""
 
-    for redshift_arg, logM_arg, rich_arg in itertools.product(
-        z_args, logM_args, rich_args
-    ):
-        assert math.isfinite(
-            cluster_abundance.compute(ccl_cosmo, rich_arg, redshift_arg)
-        )
-        assert math.isfinite(
-            cluster_abundance.compute(ccl_cosmo, logM_arg, redshift_arg)
+    # The richness and true-mass evaluations are independent of each other, so
+    # each (mass, redshift) pair only needs to be computed once.
+    for mass_args in (rich_args, logM_args):
+        values = np.array(
+            [
+                cluster_abundance.compute(ccl_cosmo, mass_arg, redshift_arg)
+                for redshift_arg, mass_arg in itertools.product(z_args, mass_args)
+            ]
         )
+        assert np.isfinite(values).all()
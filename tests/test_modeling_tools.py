@@ -17,6 +17,7 @@ def test_default_constructed_state():
     tools = ModelingTools()
     # Default constructed state is pretty barren...
     assert tools.ccl_cosmo is None
+    assert tools.ccl_cosmo_hash is None
     assert tools.pt_calculator is None
     assert len(tools.powerspectra) == 0
 
@@ -33,3 +34,15 @@ def test_no_adding_pk_twice(dummy_powerspectrum: pyccl.Pk2D):
     assert tools.powerspectra["silly"] == dummy_powerspectrum
     with pytest.raises(KeyError):
         tools.add_pk("silly", dummy_powerspectrum)
+
+
+def test_cosmology_hash_follows_prepare_and_reset():
+    tools = ModelingTools()
+    with pytest.raises(RuntimeError):
+        _ = tools.get_ccl_cosmology_hash()
+    ccl_cosmo = pyccl.CosmologyVanillaLCDM()
+    tools.prepare(ccl_cosmo)
+    assert tools.get_ccl_cosmology_hash() == hash(ccl_cosmo)
+    tools.reset()
+    with pytest.raises(RuntimeError):
+        _ = tools.get_ccl_cosmology_hash()
@@ -150,3 +150,46 @@ def test_derived_parameters_collection_add_iter():
         assert section == derived_parameter.section
         assert name == derived_parameter.name
         assert val == derived_parameter.get_val()
+
+
+def test_derived_parameters_collection_concatenate():
+    olist1 = [
+        DerivedParameterScalar("sec1", "name1", 3.14),
+        DerivedParameterScalar("sec2", "name2", 2.72),
+    ]
+    olist2 = [
+        DerivedParameterScalar("sec3", "name1", 3.14e1),
+    ]
+    dpc1 = DerivedParameterCollection(olist1)
+    dpc2 = DerivedParameterCollection(olist2)
+
+    dpc = DerivedParameterCollection.concatenate([dpc1, None, dpc2])
+
+    assert dpc == dpc1 + dpc2
+    assert dpc is not dpc1
+    assert dpc.get_derived_list() == olist1 + olist2
+    assert dpc1.get_derived_list() == olist1
+
+
+def test_derived_parameters_collection_concatenate_duplicate():
+    dpc1 = DerivedParameterCollection([DerivedParameterScalar("sec1", "name1", 3.14)])
+    dpc2 = DerivedParameterCollection([DerivedParameterScalar("sec1", "name1", 2.72)])
+
+    with pytest.raises(ValueError):
+        DerivedParameterCollection.concatenate([dpc1, dpc2])
+
+
+def test_params_map_lower_case_keys():
+    my_params = ParamsMap({"prefix_a": 1.0})
+    with pytest.raises(KeyError):
+        _ = my_params.get_from_prefix_param("PREFIX", "A")
+    my_params.use_lower_case_keys(True)
+    assert my_params.get_from_prefix_param("PREFIX", "A") == 1.0
+    assert my_params.get_from_prefix_param("prefix", "a") == 1.0
+
+
+def test_derived_parameter_scalar_has_no_dict():
+    derived_param = DerivedParameterScalar("sec1", "name1", 3.14)
+    assert not hasattr(derived_param, "__dict__")
+    assert derived_param.get_full_name() == "sec1--name1"
+    assert derived_param.get_val() == 3.14
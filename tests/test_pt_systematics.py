@@ -36,8 +36,9 @@ def fixture_number_counts_source():
     )
 
 
-@pytest.fixture(name="sacc_data")
+@pytest.fixture(name="sacc_data", scope="session")
 def fixture_sacc_data():
+    # The tests only read from the SACC data, so it is loaded once and shared.
     # Load sacc file
     # This shouldn't be necessary, since we only use the n(z) from the sacc file
     saccfile = os.path.join(
@@ -47,27 +48,10 @@ def fixture_sacc_data():
     return sacc.Sacc.load_fits(saccfile)
 
 
-def test_pt_systematics(weak_lensing_source, number_counts_source, sacc_data):
-    # The following disabling of pylint warnings are TEMPORARY. Disabling warnings is
-    # generally not a good practice. In this case, the warnings are indicating that this
-    # test is too complicated.
-    #
-    # pylint: disable-msg=too-many-locals
-    # pylint: disable-msg=too-many-statements
-    stats = [
-        TwoPoint("galaxy_shear_xi_plus", weak_lensing_source, weak_lensing_source),
-        TwoPoint("galaxy_shear_xi_minus", weak_lensing_source, weak_lensing_source),
-        TwoPoint("galaxy_shearDensity_xi_t", number_counts_source, weak_lensing_source),
-        TwoPoint("galaxy_density_xi", number_counts_source, number_counts_source),
-    ]
-
-    likelihood = ConstGaussian(statistics=stats)
-    likelihood.read(sacc_data)
-    src0_tracer = sacc_data.get_tracer("src0")
-    lens0_tracer = sacc_data.get_tracer("lens0")
-    z, nz = src0_tracer.z, src0_tracer.nz
-    lens_z, lens_nz = lens0_tracer.z, lens0_tracer.nz
-
+@pytest.fixture(name="modeling_tools", scope="session")
+def fixture_modeling_tools():
+    # Building the cosmology and the PT calculator is the most expensive part of
+    # these tests; none of the tests modifies them, so they are built only once.
     # Define a ccl.Cosmology object using default parameters
     ccl_cosmo = ccl.CosmologyVanillaLCDM()
     ccl_cosmo.compute_nonlin_power()
@@ -82,6 +66,59 @@ def test_pt_systematics(weak_lensing_source, number_counts_source, sacc_data):
     )
     modeling_tools = ModelingTools(pt_calculator=pt_calculator)
     modeling_tools.prepare(ccl_cosmo)
+    return modeling_tools
+
+
+def read_likelihood(statistics, sacc_data: sacc.Sacc) -> ConstGaussian:
+    """Return a ConstGaussian for the given statistics, read from the SACC data.
+
+    Only a couple of ells are used, to make things faster. They are set before
+    reading, so that the ells are only built once."""
+    likelihood = ConstGaussian(statistics=statistics)
+    for s in likelihood.statistics:
+        s.ell_for_xi = {"minimum": 2, "midpoint": 5, "maximum": 6e4, "n_log": 10}
+    likelihood.read(sacc_data)
+    return likelihood
+
+
+def get_tracers_nz(sacc_data: sacc.Sacc):
+    """Return the (z, nz) of the src0 and lens0 tracers of the SACC data."""
+    src0_tracer = sacc_data.get_tracer("src0")
+    lens0_tracer = sacc_data.get_tracer("lens0")
+    return (src0_tracer.z, src0_tracer.nz), (lens0_tracer.z, lens0_tracer.nz)
+
+
+def make_ia_pt_tracer(
+    ccl_cosmo: ccl.Cosmology, z, a_1: float, a_2: float, a_d: float
+) -> pt.PTIntrinsicAlignmentTracer:
+    """Return the PT intrinsic alignment tracer for the given TATT amplitudes."""
+    c_1, c_d, c_2 = pt.translate_IA_norm(
+        ccl_cosmo, z=z, a1=a_1, a1delta=a_d, a2=a_2, Om_m2_for_c2=False
+    )
+    return pt.PTIntrinsicAlignmentTracer(c1=(z, c_1), c2=(z, c_2), cdelta=(z, c_d))
+
+
+def test_pt_systematics(
+    weak_lensing_source, number_counts_source, sacc_data, modeling_tools
+):
+    # The following disabling of pylint warnings are TEMPORARY. Disabling warnings is
+    # generally not a good practice. In this case, the warnings are indicating that this
+    # test is too complicated.
+    #
+    # pylint: disable-msg=too-many-locals
+    # pylint: disable-msg=too-many-statements
+    stats = [
+        TwoPoint("galaxy_shear_xi_plus", weak_lensing_source, weak_lensing_source),
+        TwoPoint("galaxy_shear_xi_minus", weak_lensing_source, weak_lensing_source),
+        TwoPoint("galaxy_shearDensity_xi_t", number_counts_source, weak_lensing_source),
+        TwoPoint("galaxy_density_xi", number_counts_source, number_counts_source),
+    ]
+
+    likelihood = read_likelihood(stats, sacc_data)
+    (z, nz), (lens_z, lens_nz) = get_tracers_nz(sacc_data)
+
+    ccl_cosmo = modeling_tools.get_ccl_cosmology()
+    pt_calculator = modeling_tools.get_pt_calculator()
 
     # Bare CCL setup
     a_1 = 1.0
@@ -94,12 +131,8 @@ def test_pt_systematics(weak_lensing_source, number_counts_source, sacc_data):
 
     mag_bias = 1.0
 
-    c_1, c_d, c_2 = pt.translate_IA_norm(
-        ccl_cosmo, z=z, a1=a_1, a1delta=a_d, a2=a_2, Om_m2_for_c2=False
-    )
-
     # Code that creates Pk2D objects:
-    ptt_i = pt.PTIntrinsicAlignmentTracer(c1=(z, c_1), c2=(z, c_2), cdelta=(z, c_d))
+    ptt_i = make_ia_pt_tracer(ccl_cosmo, z, a_1=a_1, a_2=a_2, a_d=a_d)
     ptt_m = pt.PTMatterTracer()
     ptt_g = pt.PTNumberCountsTracer(b1=b_1, b2=b_2, bs=b_s)
     # IA
@@ -128,10 +161,6 @@ def test_pt_systematics(weak_lensing_source, number_counts_source, sacc_data):
     # Apply the systematics parameters
     likelihood.update(systematics_params)
 
-    # Make things faster by only using a couple of ells
-    for s in likelihood.statistics:
-        s.ell_for_xi = {"minimum": 2, "midpoint": 5, "maximum": 6e4, "n_log": 10}
-
     # Compute the log-likelihood, using the ccl.Cosmology object as the input
     _ = likelihood.compute_loglike(modeling_tools)
 
@@ -176,7 +205,7 @@ def test_pt_systematics(weak_lensing_source, number_counts_source, sacc_data):
         has_rsd=True,
         dndz=(lens_z, lens_nz),
         bias=None,
-        mag_bias=(lens_z, mag_bias * np.ones_like(lens_z)),
+        mag_bias=(lens_z, np.full_like(lens_z, mag_bias)),
     )
     cl_GI = ccl.angular_cl(ccl_cosmo, t_lens, t_ia, ells, p_of_k_a=pk_im)
     cl_II = ccl.angular_cl(ccl_cosmo, t_ia, t_ia, ells, p_of_k_a=pk_ii)
@@ -208,7 +237,7 @@ def test_pt_systematics(weak_lensing_source, number_counts_source, sacc_data):
     assert np.allclose(cl_gg_theory, cells_gg_total, atol=0, rtol=1e-7)
 
 
-def test_pt_mixed_systematics(sacc_data):
+def test_pt_mixed_systematics(sacc_data, modeling_tools):
     # The following disabling of pylint warnings are TEMPORARY. Disabling warnings is
     # generally not a good practice. In this case, the warnings are indicating that this
     # test is too complicated.
@@ -230,28 +259,11 @@ def test_pt_mixed_systematics(sacc_data):
     )
 
     # Create the likelihood from the statistics
-    likelihood = ConstGaussian(statistics=[stat])
-    likelihood.read(sacc_data)
-
-    src0_tracer = sacc_data.get_tracer("src0")
-    lens0_tracer = sacc_data.get_tracer("lens0")
-    z, nz = src0_tracer.z, src0_tracer.nz
-    lens_z, lens_nz = lens0_tracer.z, lens0_tracer.nz
-
-    # Define a ccl.Cosmology object using default parameters
-    ccl_cosmo = ccl.CosmologyVanillaLCDM()
-    ccl_cosmo.compute_nonlin_power()
+    likelihood = read_likelihood([stat], sacc_data)
+    (z, nz), (lens_z, lens_nz) = get_tracers_nz(sacc_data)
 
-    pt_calculator = pt.EulerianPTCalculator(
-        with_NC=True,
-        with_IA=True,
-        log10k_min=-4,
-        log10k_max=2,
-        nk_per_decade=4,
-        cosmo=ccl_cosmo,
-    )
-    modeling_tools = ModelingTools(pt_calculator=pt_calculator)
-    modeling_tools.prepare(ccl_cosmo)
+    ccl_cosmo = modeling_tools.get_ccl_cosmology()
+    pt_calculator = modeling_tools.get_pt_calculator()
 
     # Bare CCL setup
     a_1 = 1.0
@@ -261,12 +273,8 @@ def test_pt_mixed_systematics(sacc_data):
     bias = 2.0
     mag_bias = 1.0
 
-    c_1, c_d, c_2 = pt.translate_IA_norm(
-        ccl_cosmo, z=z, a1=a_1, a1delta=a_d, a2=a_2, Om_m2_for_c2=False
-    )
-
     # Code that creates Pk2D objects:
-    ptt_i = pt.PTIntrinsicAlignmentTracer(c1=(z, c_1), c2=(z, c_2), cdelta=(z, c_d))
+    ptt_i = make_ia_pt_tracer(ccl_cosmo, z, a_1=a_1, a_2=a_2, a_d=a_d)
     ptt_m = pt.PTMatterTracer()
     # IA
     pk_mi = pt_calculator.get_biased_pk2d(tracer1=ptt_m, tracer2=ptt_i)
@@ -285,10 +293,6 @@ def test_pt_mixed_systematics(sacc_data):
     # Apply the systematics parameters
     likelihood.update(systematics_params)
 
-    # Make things faster by only using a couple of ells
-    for s in likelihood.statistics:
-        s.ell_for_xi = {"minimum": 2, "midpoint": 5, "maximum": 6e4, "n_log": 10}
-
     # Compute the log-likelihood, using the ccl.Cosmology object as the input
     _ = likelihood.compute_loglike(modeling_tools)
 
@@ -317,8 +321,8 @@ def test_pt_mixed_systematics(sacc_data):
         ccl_cosmo,
         has_rsd=True,
         dndz=(lens_z, lens_nz),
-        bias=(lens_z, bias * np.ones_like(lens_z)),
-        mag_bias=(lens_z, mag_bias * np.ones_like(lens_z)),
+        bias=(lens_z, np.full_like(lens_z, bias)),
+        mag_bias=(lens_z, np.full_like(lens_z, mag_bias)),
     )
 
     # Galaxies
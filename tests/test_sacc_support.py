@@ -2,6 +2,8 @@
 Tests for function supporting SACC.
 
 """
+import sacc
+
 from firecrown.sacc_support import (
     BinZTracer,
     BinLogMTracer,
@@ -11,6 +13,14 @@ from firecrown.sacc_support import (
 )
 
 
+def test_cluster_data_types_are_standard():
+    # The cluster data types are added to sacc.standard_types when
+    # firecrown.sacc_support is imported, so they are looked up by name.
+    for data_type in ("cluster_counts", "cluster_mean_log_mass", "cluster_shear"):
+        assert getattr(sacc.standard_types, data_type) == data_type
+    assert sacc.standard_types is sacc.data_types.standard_types
+
+
 def test_make_binztracer():
     tracer = BinZTracer.make("bin_z", name="fred", lower=0.5, upper=1.0)
     assert isinstance(tracer, BinZTracer)